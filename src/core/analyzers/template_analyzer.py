@@ -27,10 +27,10 @@ class TemplateAnalyzer:
             # Container-based extraction suggests multiple items
             any(hasattr(elem, 'is_container') and elem.is_container for elem in self.context.template.elements),
             # Multiple elements suggests listing
-            any(elem.is_multiple for elem in self.context.template.elements),
+            any(getattr(elem, 'is_multiple', False) for elem in self.context.template.elements),
             # Directory-like selectors
-            any('people' in elem.selector.lower() or 'list' in elem.selector.lower() 
-                or 'grid' in elem.selector.lower() for elem in self.context.template.elements),
+            any('people' in getattr(elem, 'selector', '').lower() or 'list' in getattr(elem, 'selector', '').lower() 
+                or 'grid' in getattr(elem, 'selector', '').lower() for elem in self.context.template.elements),
             # Profile link extraction suggests directory
             any(hasattr(elem, 'sub_elements') and elem.sub_elements and 
                 any('link' in sub.get('label', '').lower() or 'profile' in sub.get('label', '').lower() 
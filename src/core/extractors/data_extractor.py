@@ -3,8 +3,11 @@
 Data extraction engine for processing scraped elements and containers.
 """
 
+import keyword
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from dataclasses import make_dataclass
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
 
 from ..context import ScrapingContext
 from ..utils.progress import ProgressTracker
@@ -12,6 +15,113 @@ from ...models.scraping_template import ElementSelector
 
 logger = logging.getLogger(__name__)
 
+# Container pages larger than this build slotted rows instead of dicts
+SLOTTED_ROW_THRESHOLD = 32
+
+
+class ContainerRow:
+    """
+    Base for slotted container rows built while a large container page is read.
+    
+    Concrete row classes are generated per sub-element label set by
+    container_row_class(). Rows are internal to the extractor and are
+    converted back to dicts by to_dict() before they are returned.
+    """
+    
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+# Selectors that can be matched against a node without querying: tag, .class, #id
+_SIMPLE_SELECTOR = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+))?$')
+
+
+def simple_selector_predicate(selector: str) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a simple CSS selector into a node predicate.
+    
+    Returns None for anything more complex than tag, .class, #id or a tag
+    combined with one class or id.
+    """
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    
+    tag, cls, element_id = match.group('tag'), match.group('cls'), match.group('id')
+    tag = tag.lower() if tag else None
+    
+    def predicate(node) -> bool:
+        if tag and str(getattr(node, 'tag', '')).lower() != tag:
+            return False
+        attrib = getattr(node, 'attrib', None) or {}
+        if cls and cls not in str(attrib.get('class', '')).split():
+            return False
+        if element_id and attrib.get('id') != element_id:
+            return False
+        return True
+    
+    return predicate
+
+
+_row_classes: Dict[Tuple[str, ...], Optional[type]] = {}
+
+
+def container_row_class(labels: Tuple[str, ...]) -> Optional[type]:
+    """
+    Get the slotted row class for a set of sub-element labels.
+    
+    Returns None when the labels cannot be used as attribute names, in which
+    case callers should fall back to plain dicts.
+    """
+    if labels in _row_classes:
+        return _row_classes[labels]
+    
+    row_class = None
+    valid = (
+        len(set(labels)) == len(labels) and
+        not any(label.startswith('_') for label in labels) and
+        all(label.isidentifier() and not keyword.iskeyword(label) for label in labels)
+    )
+    if valid:
+        fields = [(label, Any, None) for label in labels]
+        fields.append(('_container_index', int, -1))
+        row_class = make_dataclass('ContainerRowData', fields, bases=(ContainerRow,), slots=True)
+    
+    _row_classes[labels] = row_class
+    return row_class
+
+
+def _text_value(element, element_config: ElementSelector) -> str:
+    return element.text.strip() if hasattr(element, 'text') else str(element).strip()
+
+
+def _html_value(element, element_config: ElementSelector) -> str:
+    return str(element) if hasattr(element, '__str__') else element.get_attribute('outerHTML')
+
+
+def _link_value(element, element_config: ElementSelector) -> str:
+    if hasattr(element, 'attrib'):
+        return element.attrib.get('href', '')
+    return element.get_attribute('href') or ''
+
+
+def _attribute_value(element, element_config: ElementSelector) -> str:
+    attr_name = element_config.attribute_name or 'value'
+    if hasattr(element, 'attrib'):
+        return element.attrib.get(attr_name, '')
+    return element.get_attribute(attr_name) or ''
+
+
+# Single-element value readers by element_type; other types are read as text
+_ELEMENT_VALUE_READERS: Dict[str, Callable[[Any, ElementSelector], Any]] = {
+    'text': _text_value,
+    'html': _html_value,
+    'link': _link_value,
+    'attribute': _attribute_value,
+}
+
 
 class DataExtractor:
     """
@@ -37,12 +147,12 @@ class DataExtractor:
         for idx, element in enumerate(self.context.template.elements):
             try:
                 progress.update(0, f"Extracting: {element.label}")
-                logger.debug(f"Extracting data for element: {element.label}")
+                logger.debug("Extracting data for element: %s", element.label)
                 
                 value = self.extract_element_data(element)
                 extracted_data[element.label] = value
                 
-                logger.debug(f"Successfully extracted {element.label}: {str(value)[:100]}...")
+                logger.debug("Successfully extracted %s: %.100s...", element.label, value)
                 progress.update(1, f"Completed: {element.label}")
                 
             except Exception as e:
@@ -151,10 +261,10 @@ class DataExtractor:
             try:
                 elements = strategy()
                 if elements:
-                    logger.debug(f"Found elements using strategy {i+1} for {element.label}")
+                    logger.debug("Found elements using strategy %d for %s", i + 1, element.label)
                     return elements
             except Exception as e:
-                logger.debug(f"Strategy {i+1} failed for {element.label}: {e}")
+                logger.debug("Strategy %d failed for %s: %s", i + 1, element.label, e)
                 continue
         
         return []
@@ -162,45 +272,30 @@ class DataExtractor:
     def extract_single_element(self, element, element_config: ElementSelector) -> Any:
         """Extract data from a single element based on its type."""
         try:
-            if element_config.element_type == 'text':
-                return element.text.strip() if hasattr(element, 'text') else str(element).strip()
-            
-            elif element_config.element_type == 'html':
-                return str(element) if hasattr(element, '__str__') else element.get_attribute('outerHTML')
-            
-            elif element_config.element_type == 'link':
-                if hasattr(element, 'attrib'):
-                    return element.attrib.get('href', '')
-                else:
-                    return element.get_attribute('href') or ''
-            
-            elif element_config.element_type == 'attribute':
-                attr_name = element_config.attribute_name or 'value'
-                if hasattr(element, 'attrib'):
-                    return element.attrib.get(attr_name, '')
-                else:
-                    return element.get_attribute(attr_name) or ''
-            
-            else:
-                # Default to text
-                return element.text.strip() if hasattr(element, 'text') else str(element).strip()
+            read_value = _ELEMENT_VALUE_READERS.get(element_config.element_type, _text_value)
+            return read_value(element, element_config)
                 
         except Exception as e:
             logger.warning(f"Error extracting single element: {e}")
             return None
     
     def extract_multiple_elements(self, elements, element_config: ElementSelector) -> List[Any]:
-        """Extract data from multiple elements."""
+        """
+        Extract data from multiple elements.
+        
+        The reader for the element type is resolved once for the whole batch.
+        """
+        read_value = _ELEMENT_VALUE_READERS.get(element_config.element_type, _text_value)
         results = []
         
         for element in elements:
             try:
-                value = self.extract_single_element(element, element_config)
-                if value is not None:
-                    results.append(value)
+                value = read_value(element, element_config)
             except Exception as e:
                 logger.warning(f"Error extracting from multiple element: {e}")
                 continue
+            if value is not None:
+                results.append(value)
         
         return results
     
@@ -234,54 +329,109 @@ class DataExtractor:
         """
         Extract data from container elements - placeholder for full implementation.
         This method would contain the complex container extraction logic.
-        """
-        # This is a simplified version - the full implementation would be quite complex
-        containers = []
         
+        Pages with more than SLOTTED_ROW_THRESHOLD containers are collected as
+        ContainerRow instances and converted to dicts before returning, so
+        callers always get plain dicts they can index and extend.
+        """
         try:
-            logger.info(f"Extracting container data with selector: {element_config.selector}")
+            containers = [row.to_dict() if isinstance(row, ContainerRow) else row
+                          for row in self._iter_container_data(element_config)]
+            if containers:
+                logger.info("Extracted data from %d containers", len(containers))
+            return containers
             
-            # Find container elements using original selector
-            container_elements = self.current_page.css(element_config.selector)
+        except Exception as e:
+            logger.error("Error extracting container data: %s", e)
+            return []
+    
+    def _iter_container_data(self, element_config: ElementSelector) -> Iterator[Any]:
+        """Lazily yield one row per container found with the container selector."""
+        # This is a simplified version - the full implementation would be quite complex
+        logger.info("Extracting container data with selector: %s", element_config.selector)
+        
+        # Find container elements using original selector
+        container_elements = self.current_page.css(element_config.selector)
+        
+        if not container_elements:
+            logger.warning("No containers found with selector: %s", element_config.selector)
+            return
+        
+        sub_specs = []
+        if hasattr(element_config, 'sub_elements') and element_config.sub_elements:
+            for sub_element in element_config.sub_elements:
+                if isinstance(sub_element, dict):
+                    sub_specs.append((
+                        sub_element.get('label', ''),
+                        sub_element.get('selector', ''),
+                        sub_element.get('element_type', 'text')
+                    ))
+        
+        row_class = None
+        if len(container_elements) > SLOTTED_ROW_THRESHOLD:
+            row_class = container_row_class(tuple(label for label, _, _ in sub_specs))
+        
+        # Ordered sub-elements with simple selectors share one query per container
+        predicates = None
+        if getattr(element_config, 'sub_elements_ordered', False) and sub_specs:
+            predicates = [simple_selector_predicate(selector) for _, selector, _ in sub_specs]
+            if not all(predicates):
+                predicates = None
+        union_selector = ', '.join(selector for _, selector, _ in sub_specs) if predicates else None
+        
+        # Extract data from each container
+        for i, container in enumerate(container_elements):
+            container_data = {}
+            matched = self._match_ordered_sub_elements(container, union_selector, predicates) if predicates else {}
             
-            if not container_elements:
-                logger.warning(f"No containers found with selector: {element_config.selector}")
-                return []
+            # Extract sub-elements if defined
+            for position, (sub_label, sub_selector, sub_type) in enumerate(sub_specs):
+                try:
+                    # Find sub-element within container
+                    if position in matched:
+                        sub_elements = [matched[position]]
+                    else:
+                        sub_elements = container.css(sub_selector)
+                    if sub_elements:
+                        value = self.extract_element_value(sub_elements[0], sub_type)
+                        container_data[sub_label] = value
+                    else:
+                        container_data[sub_label] = None
+                except Exception as e:
+                    logger.warning("Error extracting sub-element %s: %s", sub_label, e)
+                    container_data[sub_label] = None
             
-            # Extract data from each container
-            for i, container in enumerate(container_elements):
-                container_data = {}
-                
-                # Extract sub-elements if defined
-                if hasattr(element_config, 'sub_elements') and element_config.sub_elements:
-                    for sub_element in element_config.sub_elements:
-                        if isinstance(sub_element, dict):
-                            sub_selector = sub_element.get('selector', '')
-                            sub_label = sub_element.get('label', '')
-                            sub_type = sub_element.get('element_type', 'text')
-                            
-                            try:
-                                # Find sub-element within container
-                                sub_elements = container.css(sub_selector)
-                                if sub_elements:
-                                    value = self.extract_element_value(sub_elements[0], sub_type)
-                                    container_data[sub_label] = value
-                                else:
-                                    container_data[sub_label] = None
-                            except Exception as e:
-                                logger.warning(f"Error extracting sub-element {sub_label}: {e}")
-                                container_data[sub_label] = None
-                
-                # Add container index for tracking
+            # Add container index for tracking
+            if row_class is not None:
+                yield row_class(**container_data, _container_index=i)
+            else:
                 container_data['_container_index'] = i
-                containers.append(container_data)
-            
-            logger.info(f"Extracted data from {len(containers)} containers")
-            return containers
-            
+                yield container_data
+    
+    def _match_ordered_sub_elements(self, container, union_selector: str,
+                                    predicates: List[Callable[[Any], bool]]) -> Dict[int, Any]:
+        """
+        Match ordered sub-elements in a single walk over one union query.
+        
+        Returns the first node for each sub-element position that was found in
+        document order. Positions left out are queried individually by the caller.
+        """
+        matched = {}
+        try:
+            nodes = container.css(union_selector)
         except Exception as e:
-            logger.error(f"Error extracting container data: {e}")
-            return []
+            logger.debug("Union sub-element query failed: %s", e)
+            return matched
+        
+        position = 0
+        for node in nodes:
+            if position >= len(predicates):
+                break
+            if predicates[position](node):
+                matched[position] = node
+                position += 1
+        
+        return matched
     
     def merge_related_containers(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -302,10 +452,10 @@ class DataExtractor:
                     
                     if has_basic_fields and not has_subpage_fields:
                         main_containers[label] = data
-                        logger.info(f"Identified '{label}' as main container with {len(data)} items")
+                        logger.info("Identified '%s' as main container with %d items", label, len(data))
                     elif has_subpage_fields or 'subpage' in label.lower() or 'second' in label.lower():
                         subpage_containers[label] = data
-                        logger.info(f"Identified '{label}' as subpage container with {len(data)} items")
+                        logger.info("Identified '%s' as subpage container with %d items", label, len(data))
                     else:
                         other_data[label] = data
                 else:
@@ -315,47 +465,51 @@ class DataExtractor:
             if main_containers and subpage_containers:
                 logger.info("Merging main and subpage containers...")
                 
+                # Per-label lookup tables, built on first use in a single pass
+                subpage_indexes = {}
+                
                 for main_label, main_data in main_containers.items():
                     for main_item in main_data:
                         if not isinstance(main_item, dict) or '_profile_link' not in main_item:
                             continue
                             
-                        main_profile_link = main_item['_profile_link']
+                        main_profile_link = main_item.get('_profile_link')
                         main_index = main_item.get('_container_index')
                         
                         # Find matching subpage data
                         for subpage_label, subpage_data in subpage_containers.items():
-                            for subpage_item in subpage_data:
-                                if not isinstance(subpage_item, dict):
-                                    continue
-                                    
-                                subpage_profile_link = subpage_item.get('_profile_link')
-                                subpage_index = subpage_item.get('_container_index')
+                            if subpage_label not in subpage_indexes:
+                                subpage_indexes[subpage_label] = self._index_subpage_items(subpage_data)
+                            by_link, by_index = subpage_indexes[subpage_label]
+                            
+                            # Match by profile link or container index
+                            matches = {}
+                            if main_profile_link:
+                                matches.update(by_link.get(main_profile_link, ()))
+                            if main_index is not None:
+                                matches.update(by_index.get(main_index, ()))
+                            
+                            for _, subpage_item in sorted(matches.items(), key=lambda match: match[0]):
+                                # Merge subpage data into main item
+                                subpage_info = {k: v for k, v in subpage_item.items() 
+                                              if not k.startswith('_')}
                                 
-                                # Match by profile link or container index
-                                if (main_profile_link and subpage_profile_link and main_profile_link == subpage_profile_link) or \
-                                   (main_index is not None and subpage_index is not None and main_index == subpage_index):
-                                    
-                                    # Merge subpage data into main item
-                                    subpage_info = {k: v for k, v in subpage_item.items() 
-                                                  if not k.startswith('_')}
+                                # Nest subpage data under a clear key
+                                if subpage_info:
+                                    if 'education' in subpage_label.lower() or 'credential' in subpage_label.lower():
+                                        # Add education/credentials directly to the main profile
+                                        for key, value in subpage_info.items():
+                                            main_item[key] = value
+                                    else:
+                                        # For other subpage data, nest under descriptive key
+                                        clean_label = subpage_label.replace('container', '').replace('second', '').strip()
+                                        main_item[f'{clean_label}_details'] = subpage_info
                                     
-                                    # Nest subpage data under a clear key
-                                    if subpage_info:
-                                        if 'education' in subpage_label.lower() or 'credential' in subpage_label.lower():
-                                            # Add education/credentials directly to the main profile
-                                            for key, value in subpage_info.items():
-                                                main_item[key] = value
-                                        else:
-                                            # For other subpage data, nest under descriptive key
-                                            clean_label = subpage_label.replace('container', '').replace('second', '').strip()
-                                            main_item[f'{clean_label}_details'] = subpage_info
-                                        
-                                        logger.debug(f"Merged {subpage_label} data into {main_label} item {main_index}")
+                                    logger.debug("Merged %s data into %s item %s", subpage_label, main_label, main_index)
                 
                 # Return merged data (main containers + other data, exclude processed subpage containers)
                 merged_result = {**main_containers, **other_data}
-                logger.info(f"Successfully merged containers. Final structure: {list(merged_result.keys())}")
+                logger.info("Successfully merged containers. Final structure: %s", list(merged_result))
                 return merged_result
             
             # If no merging needed, return original data
@@ -365,6 +519,30 @@ class DataExtractor:
             logger.warning(f"Error merging containers: {e}")
             return extracted_data
     
+    def _index_subpage_items(self, subpage_data: Iterable[Any]) -> Tuple[Dict[Any, list], Dict[Any, list]]:
+        """
+        Index subpage items by profile link and by container index.
+        
+        Each entry is a list of (position, item) pairs so that matches can be
+        replayed in their original order.
+        """
+        by_link = {}
+        by_index = {}
+        
+        for position, subpage_item in enumerate(subpage_data):
+            if not isinstance(subpage_item, dict):
+                continue
+            
+            subpage_profile_link = subpage_item.get('_profile_link')
+            subpage_index = subpage_item.get('_container_index')
+            
+            if subpage_profile_link:
+                by_link.setdefault(subpage_profile_link, []).append((position, subpage_item))
+            if subpage_index is not None:
+                by_index.setdefault(subpage_index, []).append((position, subpage_item))
+        
+        return by_link, by_index
+    
     # Fallback strategy methods
     def try_automatch_selector(self, element: ElementSelector) -> List:
         """Try AutoMatch with the original selector."""
@@ -384,7 +562,7 @@ class DataExtractor:
             try:
                 return self.current_page.xpath(xpath_expr)
             except Exception as e:
-                logger.debug(f"XPath failed: {e}")
+                logger.debug("XPath failed: %s", e)
                 return []
         else:
             return self.current_page.css(element.selector)
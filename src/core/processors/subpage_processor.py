@@ -5,20 +5,47 @@ Subpage processing for automated scraping with navigation and data extraction.
 
 import time
 import logging
-from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin
 
 from ..context import ScrapingContext
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _selector_attempts(selector: str) -> Tuple[str, ...]:
+    """Split a comma-separated selector group into the selectors to try in order."""
+    return tuple(part.strip() for part in selector.split(',') if part.strip())
+
+
+def _sub_element_fields(sub_element) -> Tuple[str, str, str]:
+    """Return (label, selector, element_type) for a dict or SubElement-style sub-element."""
+    if isinstance(sub_element, dict):
+        return sub_element.get('label'), sub_element.get('selector'), sub_element.get('element_type', 'text')
+    return sub_element.label, sub_element.selector, sub_element.element_type
+
+
+def _clean_text(element) -> str:
+    """Return an element's stripped text, or '' for empty and 'none' placeholder values."""
+    text = element.text if hasattr(element, 'text') else str(element)
+    if not text:
+        return ''
+    text = text.strip()
+    return '' if text.lower() == 'none' else text
+
+
 class SubpageProcessor:
     """
     Handles all subpage processing functionality including navigation, 
     data extraction, and merging operations.
     """
     
+    # Most recently fetched subpages kept for repeat visits; each holds a parsed DOM
+    PAGE_CACHE_SIZE = 32
+    
     def __init__(self, context: ScrapingContext, fetcher_instance=None, sublink_engine=None):
         """
         Initialize the SubpageProcessor.
@@ -35,7 +62,9 @@ class SubpageProcessor:
         self.fetcher_instance = fetcher_instance
         self.sublink_engine = sublink_engine
         self.sublink_queue = []
+        self._queued_urls = set()  # URLs already in sublink_queue, for O(1) dedup
         self.processed_sublinks = []
+        self._page_cache = OrderedDict()
         self.sublink_context = None
         self.sublink_page = None
     
@@ -75,12 +104,12 @@ class SubpageProcessor:
         original_page = self.current_page
         
         try:
-            logger.debug(f"Navigating to subpage for container data: {profile_url}")
+            logger.debug("Navigating to subpage for container data: %s", profile_url)
             
             # Navigate to the profile page
-            subpage = self.fetch_page(profile_url)
+            subpage = self._fetch_subpage(profile_url)
             if not subpage:
-                logger.warning(f"Failed to fetch subpage: {profile_url}")
+                logger.warning("Failed to fetch subpage: %s", profile_url)
                 return {}
             
             # Temporarily switch to subpage context
@@ -90,14 +119,7 @@ class SubpageProcessor:
             if hasattr(element_config, 'sub_elements') and element_config.sub_elements:
                 for sub_element in element_config.sub_elements:
                     try:
-                        if isinstance(sub_element, dict):
-                            sub_label = sub_element.get('label')
-                            sub_selector = sub_element.get('selector')
-                            sub_type = sub_element.get('element_type', 'text')
-                        else:
-                            sub_label = sub_element.label
-                            sub_selector = sub_element.selector
-                            sub_type = sub_element.element_type
+                        sub_label, sub_selector, sub_type = _sub_element_fields(sub_element)
                         
                         # Enhance selector for subpage context
                         sub_element_dict = {
@@ -108,14 +130,12 @@ class SubpageProcessor:
                         
                         enhanced_selector = self.map_generic_selector(sub_element_dict, "profile")
                         if enhanced_selector != sub_selector:
-                            logger.info(f"Enhanced subpage selector for {sub_label}: '{sub_selector}' → '{enhanced_selector}'")
+                            logger.info("Enhanced subpage selector for %s: '%s' → '%s'", sub_label, sub_selector, enhanced_selector)
                             sub_selector = enhanced_selector
                         
                         # Find elements on the subpage
                         elements = []
-                        selectors_to_try = [s.strip() for s in sub_selector.split(',') if s.strip()]
-                        
-                        for selector_attempt in selectors_to_try:
+                        for selector_attempt in _selector_attempts(sub_selector):
                             try:
                                 if selector_attempt.startswith('xpath:'):
                                     xpath_expr = selector_attempt[6:]
@@ -124,7 +144,7 @@ class SubpageProcessor:
                                     elements = self.current_page.css(selector_attempt)
                                 
                                 if elements:
-                                    logger.debug(f"Found {len(elements)} subpage elements with selector: {selector_attempt}")
+                                    logger.debug("Found %d subpage elements with selector: %s", len(elements), selector_attempt)
                                     break
                             except Exception:
                                 continue
@@ -133,38 +153,33 @@ class SubpageProcessor:
                         if elements:
                             if sub_type == 'text' and len(elements) > 1:
                                 # Multiple text elements - extract as list, skip empty/None values
-                                text_values = []
-                                for elem in elements:
-                                    text_content = elem.text if hasattr(elem, 'text') else str(elem)
-                                    if text_content and text_content.strip() and text_content.strip().lower() != 'none':
-                                        text_values.append(text_content.strip())
+                                text_values = [text for text in map(_clean_text, elements) if text]
                                 # Only set if we have actual values
                                 if text_values:
                                     subpage_data[sub_label] = text_values
                                 else:
-                                    logger.debug(f"No valid text content found for {sub_label}")
+                                    logger.debug("No valid text content found for %s", sub_label)
                             elif elements:
                                 # Single element or first element
-                                text_content = elements[0].text if hasattr(elements[0], 'text') else str(elements[0])
-                                if text_content and text_content.strip() and text_content.strip().lower() != 'none':
-                                    subpage_data[sub_label] = text_content.strip()
+                                text_content = _clean_text(elements[0])
+                                if text_content:
+                                    subpage_data[sub_label] = text_content
                                 else:
-                                    logger.debug(f"No valid text content found for {sub_label}")
+                                    logger.debug("No valid text content found for %s", sub_label)
                         else:
-                            logger.debug(f"No elements found for subpage {sub_label} with selector {sub_selector}")
+                            logger.debug("No elements found for subpage %s with selector %s", sub_label, sub_selector)
                             
                     except Exception as e:
-                        logger.warning(f"Error extracting subpage element {sub_label}: {e}")
+                        logger.warning("Error extracting subpage element %s: %s", sub_label, e)
             
-            logger.info(f"Successfully extracted {len(subpage_data)} elements from subpage")
+            logger.info("Successfully extracted %d elements from subpage", len(subpage_data))
             
         except Exception as e:
-            logger.error(f"Error during subpage container extraction: {e}")
+            logger.error("Error during subpage container extraction: %s", e)
         
         finally:
             # Restore original page context
-            if original_page:
-                self.current_page = original_page
+            self.current_page = original_page
         
         return subpage_data
     
@@ -348,6 +363,7 @@ class SubpageProcessor:
                 
                 if hasattr(element, 'subpage_elements') and element.subpage_elements:
                     logger.info(f"Processing container subpage extraction for element: {element.label}")
+                    sub_fields = [_sub_element_fields(sub_element) for sub_element in element.subpage_elements]
                     
                     # Get the container data
                     container_data = enhanced_data.get(element.label, [])
@@ -374,24 +390,15 @@ class SubpageProcessor:
                             logger.info(f"Navigating to container subpage: {profile_link}")
                             
                             # Fetch the subpage
-                            subpage = self.fetch_page(profile_link)
+                            subpage = self._fetch_subpage(profile_link)
                             if not subpage:
                                 logger.warning(f"Failed to fetch container subpage: {profile_link}")
                                 continue
                             
                             # Extract subpage data
                             subpage_data = {}
-                            for sub_element in element.subpage_elements:
+                            for sub_label, sub_selector, sub_type in sub_fields:
                                 try:
-                                    if isinstance(sub_element, dict):
-                                        sub_label = sub_element.get('label')
-                                        sub_selector = sub_element.get('selector')
-                                        sub_type = sub_element.get('element_type', 'text')
-                                    else:
-                                        sub_label = sub_element.label
-                                        sub_selector = sub_element.selector
-                                        sub_type = sub_element.element_type
-                                    
                                     # Find elements on subpage
                                     sub_elements = []
                                     try:
@@ -441,6 +448,7 @@ class SubpageProcessor:
             return main_data
         
         enhanced_data = main_data.copy()
+        sub_fields = [_sub_element_fields(sub_element) for sub_element in element_config.subpage_elements]
         
         # Process each container item that has a profile link
         container_label = element_config.label
@@ -465,24 +473,15 @@ class SubpageProcessor:
                 logger.info(f"Navigating to subpage: {profile_link}")
                 
                 # Fetch the subpage
-                subpage = self.fetch_page(profile_link)
+                subpage = self._fetch_subpage(profile_link)
                 if not subpage:
                     logger.warning(f"Failed to fetch subpage: {profile_link}")
                     continue
                 
                 # Extract subpage data
                 subpage_data = {}
-                for sub_element in element_config.subpage_elements:
+                for sub_label, sub_selector, sub_type in sub_fields:
                     try:
-                        if isinstance(sub_element, dict):
-                            sub_label = sub_element.get('label')
-                            sub_selector = sub_element.get('selector')
-                            sub_type = sub_element.get('element_type', 'text')
-                        else:
-                            sub_label = sub_element.label
-                            sub_selector = sub_element.selector
-                            sub_type = sub_element.element_type
-                        
                         # Find elements on subpage
                         sub_elements = []
                         try:
@@ -526,19 +525,18 @@ class SubpageProcessor:
             Dictionary containing extracted subpage data
         """
         subpage_data = {}
+        original_page = self.current_page
         original_url = self.current_page.url if self.current_page else None
         
         try:
             logger.debug(f"Navigating to subpage: {profile_url}")
             
             # Navigate to the profile page
-            subpage = self.fetch_page(profile_url)
+            subpage = self._fetch_subpage(profile_url)
             if not subpage:
                 logger.warning(f"Failed to fetch subpage: {profile_url}")
                 return {}
             
-            # Store original page reference
-            original_page = self.current_page
             self.current_page = subpage
             
             # Extract data from subpage using the defined elements
@@ -619,9 +617,8 @@ class SubpageProcessor:
         
         finally:
             # Restore original page
-            if original_page:
-                self.current_page = original_page
-                logger.debug(f"Returned to main page: {original_url}")
+            self.current_page = original_page
+            logger.debug(f"Returned to main page: {original_url}")
         
         return subpage_data
     
@@ -739,7 +736,8 @@ class SubpageProcessor:
                         if profile_link and not profile_link.startswith('http'):
                             profile_link = urljoin(self.template.url, profile_link)
                         
-                        if profile_link and profile_link not in [item['url'] for item in self.sublink_queue]:
+                        if profile_link and profile_link not in self._queued_urls:
+                            self._queued_urls.add(profile_link)
                             self.sublink_queue.append({
                                 'url': profile_link,
                                 'container_index': i,
@@ -893,17 +891,18 @@ class SubpageProcessor:
             
             subpage_data = {}
             
-            # Extract data for each subpage container
-            for container in subpage_containers:
-                try:
-                    container_data = self.extract_element_data(container)
-                    if container_data:
-                        subpage_data[container.label] = container_data
-                except Exception as e:
-                    logger.warning(f"Error extracting {container.label} from subpage: {e}")
-            
-            # Restore original page
-            self.current_page = original_page
+            try:
+                # Extract data for each subpage container
+                for container in subpage_containers:
+                    try:
+                        container_data = self.extract_element_data(container)
+                        if container_data:
+                            subpage_data[container.label] = container_data
+                    except Exception as e:
+                        logger.warning(f"Error extracting {container.label} from subpage: {e}")
+            finally:
+                # Restore original page
+                self.current_page = original_page
             
             return subpage_data
             
@@ -912,6 +911,31 @@ class SubpageProcessor:
             return {}
     
     # Helper methods
+    def _fetch_subpage(self, url: str):
+        """
+        Fetch a subpage, reusing the page from a recent fetch of the same URL.
+        
+        Args:
+            url: Subpage URL; the fragment is ignored
+            
+        Returns:
+            Page object or None if the fetch failed
+        """
+        key = urldefrag(url).url
+        page = self._page_cache.get(key)
+        if page is not None:
+            self._page_cache.move_to_end(key)
+            logger.debug("Reusing cached subpage: %s", url)
+            return page
+        
+        page = self.fetch_page(url)
+        # Error responses are returned to the caller but fetched again next time
+        if page and page.status == 200:
+            self._page_cache[key] = page
+            if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return page
+    
     def fetch_page(self, url: str):
         """Fetch a page using the browser instance."""
         # Placeholder - would be implemented using self.fetcher
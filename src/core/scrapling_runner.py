@@ -13,6 +13,8 @@ import time
 import json
 import csv
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
@@ -275,14 +277,17 @@ class ScraplingRunner:
     run in headless server environments.
     """
     
-    def __init__(self, template: ScrapingTemplate):
+    def __init__(self, template: ScrapingTemplate, fetcher: Optional[PlayWrightFetcher] = None):
         """
         Initialize the Scrapling runner with a template.
         
         Args:
             template: The scraping template to execute
+            fetcher: Optional main-engine fetcher shared with other runners;
+                the runner uses it instead of building its own and never closes it
         """
         self.template = template
+        self.shared_fetcher = fetcher
         self.fetcher = None
         self.fetcher_instance = None  # Single browser instance
         self.current_page = None
@@ -962,7 +967,7 @@ class ScraplingRunner:
             PlayWrightFetcher.configure(auto_match=True)
             
             # Engine 1: Main directory page browser
-            self.main_engine = PlayWrightFetcher()
+            self.main_engine = self.shared_fetcher or PlayWrightFetcher()
             self.main_page = None
             print("✅ Engine 1 (Main Directory): Initialized")
             
@@ -3330,28 +3335,30 @@ class ScraplingRunner:
                         except Exception as e:
                             logger.warning(f"Error closing page: {e}")
                 
-                # Try to close the browser contexts
-                if hasattr(self.fetcher_instance, 'browser') and self.fetcher_instance.browser:
-                    try:
-                        # Close all contexts
-                        if hasattr(self.fetcher_instance.browser, 'contexts'):
-                            for context in self.fetcher_instance.browser.contexts:
-                                try:
-                                    context.close()
-                                except Exception as e:
-                                    logger.warning(f"Error closing context: {e}")
-                        
-                        # Close the browser
-                        self.fetcher_instance.browser.close()
-                    except Exception as e:
-                        logger.warning(f"Error closing browser: {e}")
-                
-                # Try to close the playwright instance
-                if hasattr(self.fetcher_instance, 'playwright') and self.fetcher_instance.playwright:
-                    try:
-                        self.fetcher_instance.playwright.stop()
-                    except Exception as e:
-                        logger.warning(f"Error stopping playwright: {e}")
+                # A shared fetcher belongs to the batch, which outlives this runner
+                if self.fetcher_instance is not self.shared_fetcher:
+                    # Try to close the browser contexts
+                    if hasattr(self.fetcher_instance, 'browser') and self.fetcher_instance.browser:
+                        try:
+                            # Close all contexts
+                            if hasattr(self.fetcher_instance.browser, 'contexts'):
+                                for context in self.fetcher_instance.browser.contexts:
+                                    try:
+                                        context.close()
+                                    except Exception as e:
+                                        logger.warning(f"Error closing context: {e}")
+                            
+                            # Close the browser
+                            self.fetcher_instance.browser.close()
+                        except Exception as e:
+                            logger.warning(f"Error closing browser: {e}")
+                    
+                    # Try to close the playwright instance
+                    if hasattr(self.fetcher_instance, 'playwright') and self.fetcher_instance.playwright:
+                        try:
+                            self.fetcher_instance.playwright.stop()
+                        except Exception as e:
+                            logger.warning(f"Error stopping playwright: {e}")
                 
                 self.fetcher_instance = None
                 logger.info("Browser session closed successfully")
@@ -5165,10 +5172,17 @@ class ScraplingRunner:
 class BatchScraplingRunner:
     """
     Handles batch processing of multiple URLs using a single template.
+    
+    URLs are scraped one after another by default, and every runner reuses
+    one main-engine fetcher that the batch opens and closes. With
+    max_workers > 1 they are scraped concurrently, each by its own
+    ScraplingRunner and browser, since Playwright's sync API cannot share a
+    browser across threads.
     """
     
-    def __init__(self, template: ScrapingTemplate):
+    def __init__(self, template: ScrapingTemplate, max_workers: int = 1):
         self.template = template
+        self.max_workers = max_workers
     
     def execute_batch(self, urls: List[str]) -> List[ScrapingResult]:
         """
@@ -5178,37 +5192,78 @@ class BatchScraplingRunner:
             urls: List of URLs to scrape
             
         Returns:
-            List of ScrapingResult objects
+            List of ScrapingResult objects, in the same order as urls
         """
+        if self.max_workers > 1 and len(urls) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+                return list(executor.map(self._scrape_one, urls, range(len(urls)), repeat(len(urls))))
+        
         results = []
+        if not urls:
+            return results
         
-        for i, url in enumerate(urls):
-            try:
-                logger.info(f"Processing URL {i+1}/{len(urls)}: {url}")
-                
-                # Create a copy of the template with the new URL
-                url_template = self.template.model_copy()
-                url_template.url = url
-                
-                # Execute scraping
-                runner = ScraplingRunner(url_template)
-                result = runner.execute_scraping()
-                results.append(result)
+        # Main-engine fetcher shared by the runners of this serial batch
+        PlayWrightFetcher.configure(auto_match=True)
+        fetcher = PlayWrightFetcher()
+        
+        try:
+            for i, url in enumerate(urls):
+                results.append(self._scrape_one(url, i, len(urls), fetcher))
                 
                 # Add delay between requests to be respectful
                 if i < len(urls) - 1:  # Don't wait after the last URL
                     time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Failed to process URL {url}: {e}")
-                
-                # Create a failure result
-                error_result = ScrapingResult(
-                    template_name=self.template.name,
-                    url=url,
-                    success=False,
-                    errors=[str(e)]
-                )
-                results.append(error_result)
-        
-        return results
\ No newline at end of file
+        finally:
+            self._close_fetcher(fetcher)
+        
+        return results
+    
+    def _close_fetcher(self, fetcher: PlayWrightFetcher) -> None:
+        """Close the browser and Playwright instance behind a batch fetcher."""
+        try:
+            if hasattr(fetcher, 'browser') and fetcher.browser:
+                fetcher.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing batch browser: {e}")
+        
+        try:
+            if hasattr(fetcher, 'playwright') and fetcher.playwright:
+                fetcher.playwright.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping batch playwright: {e}")
+    
+    def _scrape_one(self, url: str, index: int, total: int,
+                    fetcher: Optional[PlayWrightFetcher] = None) -> ScrapingResult:
+        """
+        Scrape a single URL of the batch with its own runner.
+        
+        Args:
+            url: URL to scrape
+            index: Position of the URL in the batch
+            total: Number of URLs in the batch
+            fetcher: Shared fetcher to hand to the runner, if any
+            
+        Returns:
+            ScrapingResult for the URL, or a failure result if scraping raised
+        """
+        try:
+            logger.info(f"Processing URL {index+1}/{total}: {url}")
+            
+            # Create a copy of the template with the new URL
+            url_template = self.template.model_copy()
+            url_template.url = url
+            
+            # Execute scraping
+            runner = ScraplingRunner(url_template, fetcher=fetcher)
+            return runner.execute_scraping()
+            
+        except Exception as e:
+            logger.error(f"Failed to process URL {url}: {e}")
+            
+            # Create a failure result
+            return ScrapingResult(
+                template_name=self.template.name,
+                url=url,
+                success=False,
+                errors=[str(e)]
+            )
@@ -11,11 +11,17 @@ import logging
 import time
 import json
 import csv
+import operator
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard library encoder
+    orjson = None
+
 from scrapling.fetchers import PlayWrightFetcher, StealthyFetcher
 from scrapling import Adaptor
 
@@ -30,6 +36,10 @@ from .processors.subpage_processor import SubpageProcessor
 
 logger = logging.getLogger(__name__)
 
+# Cookie fields passed to Scrapling, read in one attrgetter call per cookie
+_COOKIE_KEYS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')
+_get_cookie_fields = operator.attrgetter(*_COOKIE_KEYS)
+
 
 class ScraplingRunner:
     """
@@ -325,25 +335,8 @@ class ScraplingRunner:
     
     def _format_cookies_for_scrapling(self) -> List[Dict[str, Any]]:
         """Format cookies for Scrapling."""
-        formatted_cookies = []
-        
-        if hasattr(self.template, 'cookies') and self.template.cookies:
-            for cookie in self.template.cookies:
-                formatted_cookie = {
-                    'name': cookie.name,
-                    'value': cookie.value,
-                    'domain': cookie.domain,
-                    'path': cookie.path,
-                }
-                # Add optional fields if they exist
-                if hasattr(cookie, 'secure'):
-                    formatted_cookie['secure'] = cookie.secure
-                if hasattr(cookie, 'httpOnly'):
-                    formatted_cookie['httpOnly'] = cookie.httpOnly
-                    
-                formatted_cookies.append(formatted_cookie)
-        
-        return formatted_cookies
+        cookies = getattr(self.template, 'cookies', None) or ()
+        return [dict(zip(_COOKIE_KEYS, _get_cookie_fields(cookie))) for cookie in cookies]
     
     def _create_unified_output_structure(self, scraped_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create unified output structure from scraped data."""
@@ -466,8 +459,13 @@ class ScraplingRunner:
             'errors': result.errors
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Serialize in C and write the UTF-8 bytes in one call
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
 
     def _export_csv(self, result: ScrapingResult, output_file: str) -> None:
         """Export data to CSV format."""
@@ -477,14 +475,11 @@ class ScraplingRunner:
         if not flattened_data:
             raise ValueError("No data to export to CSV")
         
-        # If data is a list of records, write multiple rows
-        if isinstance(flattened_data, list):
-            df = pd.DataFrame(flattened_data)
-        else:
-            # Single record
-            df = pd.DataFrame([flattened_data])
-        
-        df.to_csv(output_file, index=False, encoding='utf-8')
+        # Write the header and the single record straight through csv.writer
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(flattened_data.keys())
+            writer.writerow(flattened_data.values())
 
     def _export_excel(self, result: ScrapingResult, output_file: str) -> None:
         """Export data to Excel format."""
@@ -530,29 +525,37 @@ class ScraplingRunner:
         Returns:
             Flattened data suitable for CSV/Excel export
         """
-        flattened = {}
+        return dict(self._iter_flattened_items(data))
+
+    def _iter_flattened_items(self, data: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the (column, value) pairs of the flattened data in a single pass.
         
+        Args:
+            data: Dictionary containing scraped data
+            
+        Returns:
+            Iterator over flattened column names and values
+        """
         for key, value in data.items():
             if key == 'actions_executed':
                 continue  # Skip actions for tabular export
                 
             if isinstance(value, list):
                 if len(value) == 1:
-                    flattened[key] = value[0]
+                    yield key, value[0]
                 elif len(value) > 1:
                     # For multiple values, create separate columns
-                    for i, item in enumerate(value):
-                        flattened[f"{key}_{i+1}"] = item
+                    for i, item in enumerate(value, 1):
+                        yield f"{key}_{i}", item
                 else:
-                    flattened[key] = ""
+                    yield key, ""
             elif isinstance(value, dict):
                 # Flatten nested dictionaries
                 for subkey, subvalue in value.items():
-                    flattened[f"{key}_{subkey}"] = subvalue
+                    yield f"{key}_{subkey}", subvalue
             else:
-                flattened[key] = value
-        
-        return flattened
+                yield key, value
 
     def __del__(self):
         """Destructor to ensure cleanup."""
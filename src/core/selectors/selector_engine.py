@@ -3,15 +3,85 @@
 Selector enhancement and fallback generation utilities.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from ..context import ScrapingContext
 
 
+_NAME_DIRECTORY = "strong, p.name strong, h3, h2, .name, [class*='name'] strong, strong:first-of-type"
+_NAME_PROFILE = "h1, h2, .entry-title, .page-title, .lawyer-name, .attorney-name"
+_TITLE_DIRECTORY = ".title, .position, .job-title, [class*='title'], [class*='position'], p.title span:first-child, span[class*='position']"
+_TITLE_PROFILE = ".position, .title, .job-title, h2 + p, h1 + p"
+_EMAIL = "a[href^='mailto:'], p.contact-details a[href^='mailto:'], .email, [class*='email'], a[href*='@']"
+_PHONE = "a[href^='tel:'], .phone, [class*='phone'], a[href*='tel']"
+_SECTOR_DIRECTORY = ".practice-area, .sector, [class*='practice'], [class*='sector'], p.contact-details span:not([class*='position']), p.title span:last-child, span[class*='practice']"
+_SECTOR_PROFILE = ".practice-area, .capabilities, .focus-areas, a[href*='/practice/']"
+_PROFILE_LINK = "a[href*='/lawyer/'], a[href*='/attorney/'], a[href*='/people/'], a[href*='/team/'], a"
+# More specific selectors for repeated education/credential fields to avoid duplication
+_EDUCATION_FIRST = ".education li:first-child, .education li:first-of-type, ul[class*='education'] li:first-child"
+_EDUCATION_REST = ".education li:nth-of-type(n+2), ul[class*='education'] li:nth-of-type(n+2)"
+_CREDENTIALS_FIRST = ".admissions li:first-child, .bar li:first-child, .credentials li:first-child"
+_CREDENTIALS_REST = ".admissions li:nth-of-type(n+2), .bar li:nth-of-type(n+2), .credentials li:nth-of-type(n+2)"
+
+# (label keyword, directory selector, profile selector) in match priority order;
+# the first keyword found in the label wins
+_LABEL_SELECTORS = (
+    ('name', _NAME_DIRECTORY, _NAME_PROFILE),
+    ('title', _TITLE_DIRECTORY, _TITLE_PROFILE),
+    ('position', _TITLE_DIRECTORY, _TITLE_PROFILE),
+    ('job', _TITLE_DIRECTORY, _TITLE_PROFILE),
+    ('email', _EMAIL, _EMAIL),
+    ('mail', _EMAIL, _EMAIL),
+    ('phone', _PHONE, _PHONE),
+    ('sector', _SECTOR_DIRECTORY, _SECTOR_PROFILE),
+    ('practice', _SECTOR_DIRECTORY, _SECTOR_PROFILE),
+    ('area', _SECTOR_DIRECTORY, _SECTOR_PROFILE),
+    ('link', _PROFILE_LINK, _PROFILE_LINK),
+    ('profile', _PROFILE_LINK, _PROFILE_LINK),
+    ('url', _PROFILE_LINK, _PROFILE_LINK),
+    ('education2', _EDUCATION_REST, _EDUCATION_REST),
+    ('education', _EDUCATION_FIRST, _EDUCATION_FIRST),
+    ('creds2', _CREDENTIALS_REST, _CREDENTIALS_REST),
+    ('cred', _CREDENTIALS_FIRST, _CREDENTIALS_FIRST),
+    ('admission', _CREDENTIALS_FIRST, _CREDENTIALS_FIRST),
+    ('bar', _CREDENTIALS_FIRST, _CREDENTIALS_FIRST),
+)
+
+
+@lru_cache(maxsize=1024)
+def _map_selector(label: str, original_selector: str, context: str) -> str:
+    """Map a label and selector to an enhanced selector.
+    
+    Pure and keyed on plain strings, so results are cached across engines:
+    crawls map the same handful of labels for every scraped row. The label
+    is lowercased here, so repeat lookups skip that work too.
+    """
+    # Always preserve XPath selectors - they are position-specific and already optimized
+    if original_selector.startswith('xpath:'):
+        return original_selector
+    
+    # If selector is already specific, keep it
+    if len(original_selector) > 10 and ('.' in original_selector or '#' in original_selector or '[' in original_selector):
+        return original_selector
+    
+    # Map generic selectors based on label
+    label = label.lower()
+    for keyword, directory_selector, profile_selector in _LABEL_SELECTORS:
+        if keyword in label:
+            return directory_selector if context == "directory" else profile_selector
+    
+    # Default fallback - return original
+    return original_selector
+
+
 class SelectorEngine:
     """
     Handles selector enhancement, fallback generation, and CSS/XPath conversion.
     """
     
-    def __init__(self, context: ScrapingContext):
+    def __init__(self, context: Optional[ScrapingContext] = None):
+        # Selector mapping is pure; the context is optional for mapping-only use
         self.context = context
     
     def map_generic_selector(self, sub_element: dict, context: str = "directory") -> str:
@@ -25,61 +95,4 @@ class SelectorEngine:
         Returns:
             Enhanced selector string
         """
-        label = sub_element.get('label', '').lower()
-        original_selector = sub_element.get('selector', '')
-        
-        # Always preserve XPath selectors - they are position-specific and already optimized
-        if original_selector.startswith('xpath:'):
-            return original_selector
-        
-        # If selector is already specific, keep it
-        if len(original_selector) > 10 and ('.' in original_selector or '#' in original_selector or '[' in original_selector):
-            return original_selector
-        
-        # Map generic selectors based on label
-        if 'name' in label:
-            if context == "directory":
-                return "strong, p.name strong, h3, h2, .name, [class*='name'] strong, strong:first-of-type"
-            else:
-                return "h1, h2, .entry-title, .page-title, .lawyer-name, .attorney-name"
-                
-        elif any(keyword in label for keyword in ['title', 'position', 'job']):
-            if context == "directory":
-                return ".title, .position, .job-title, [class*='title'], [class*='position'], p.title span:first-child, span[class*='position']"
-            else:
-                return ".position, .title, .job-title, h2 + p, h1 + p"
-                
-        elif any(keyword in label for keyword in ['email', 'mail']):
-            return "a[href^='mailto:'], p.contact-details a[href^='mailto:'], .email, [class*='email'], a[href*='@']"
-            
-        elif 'phone' in label:
-            return "a[href^='tel:'], .phone, [class*='phone'], a[href*='tel']"
-            
-        elif any(keyword in label for keyword in ['sector', 'practice', 'area']):
-            if context == "directory":
-                return ".practice-area, .sector, [class*='practice'], [class*='sector'], p.contact-details span:not([class*='position']), p.title span:last-child, span[class*='practice']"
-            else:
-                return ".practice-area, .capabilities, .focus-areas, a[href*='/practice/']"
-                
-        elif any(keyword in label for keyword in ['link', 'profile', 'url']) or 'email' in label:
-            if 'email' in label:
-                return "a[href^='mailto:'], .email, [class*='email'], a[href*='@']"
-            else:
-                return "a[href*='/lawyer/'], a[href*='/attorney/'], a[href*='/people/'], a[href*='/team/'], a"
-            
-        elif 'education' in label:
-            # More specific selectors for education to avoid duplication
-            if 'education2' in label:
-                return ".education li:nth-of-type(n+2), ul[class*='education'] li:nth-of-type(n+2)"
-            else:
-                return ".education li:first-child, .education li:first-of-type, ul[class*='education'] li:first-child"
-            
-        elif any(keyword in label for keyword in ['cred', 'admission', 'bar']):
-            # More specific selectors for credentials to avoid duplication
-            if 'creds2' in label:
-                return ".admissions li:nth-of-type(n+2), .bar li:nth-of-type(n+2), .credentials li:nth-of-type(n+2)"
-            else:
-                return ".admissions li:first-child, .bar li:first-child, .credentials li:first-child"
-        
-        # Default fallback - return original
-        return original_selector
\ No newline at end of file
+        return _map_selector(sub_element.get('label', ''), sub_element.get('selector', ''), context)
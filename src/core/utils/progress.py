@@ -3,52 +3,153 @@
 Progress tracking utilities for scraping operations.
 """
 
+import json
 import time
 import sys
 
+BAR_LENGTH = 40
+
+NS_PER_SECOND = 1_000_000_000
+
+# Weight of the newest sample in the smoothed items-per-second rate
+RATE_SMOOTHING = 0.1
+
+# Every bar state, indexed by the number of filled cells
+_BAR_CACHE = tuple('█' * filled + '░' * (BAR_LENGTH - filled) for filled in range(BAR_LENGTH + 1))
+
+# Percentage labels from 0.0% to 100.0%, indexed in tenths of a percent
+_PCT_CACHE = tuple(f"{tenths / 10:.1f}%" for tenths in range(1001))
+
 
 class ProgressTracker:
     """
     Terminal progress bar for scraping operations.
+    
+    On a terminal the bar is redrawn in place at most once per
+    FRAME_INTERVAL_NS. When output is piped or redirected, progress is written
+    as JSON lines at most once per PIPE_FRAME_INTERVAL_NS instead. The final
+    frame is always drawn. Elapsed time comes from the monotonic clock, so clock
+    adjustments cannot skew the ETA, which is based on a moving average of
+    the rate observed by update().
     """
     
+    FRAME_INTERVAL_NS = 50_000_000
+    PIPE_FRAME_INTERVAL_NS = NS_PER_SECOND
+    
+    __slots__ = (
+        '_total', '_tenths_divisor', 'current', 'description', 'start_time_ns',
+        '_rate', '_last_update_ns',
+        '_out', '_tty', '_frame_interval_ns', '_last_draw', '_last_frame_key', '_eta_cache_key', '_eta_cache_val',
+    )
+    
     def __init__(self, total: int, description: str = "Progress"):
         self.total = total
         self.current = 0
         self.description = description
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
+        self._rate = 0.0
+        self._last_update_ns = self.start_time_ns
+        self._out = sys.stdout
+        isatty = getattr(self._out, 'isatty', None)
+        self._tty = bool(isatty and isatty())
+        self._frame_interval_ns = self.FRAME_INTERVAL_NS if self._tty else self.PIPE_FRAME_INTERVAL_NS
+        self._last_draw = None
+        self._last_frame_key = None
+        self._eta_cache_key = None
+        self._eta_cache_val = ""
         
+    @property
+    def total(self) -> int:
+        """Number of steps that make up 100%."""
+        return self._total
+    
+    @total.setter
+    def total(self, value: int):
+        self._total = value
+        # Divisor for rounding progress to the nearest tenth of a percent
+        self._tenths_divisor = 2 * value
+    
+    @property
+    def start_time(self) -> float:
+        """Start of tracking on the monotonic clock, in seconds."""
+        return self.start_time_ns / NS_PER_SECOND
+    
     def update(self, increment: int = 1, description: str = None):
         """Update progress bar."""
         self.current += increment
+        
+        if increment:
+            now = time.monotonic_ns()
+            interval_ns = now - self._last_update_ns
+            if interval_ns > 0:
+                rate = increment * NS_PER_SECOND / interval_ns
+                # Seed the moving average with the first sample
+                self._rate = RATE_SMOOTHING * rate + (1 - RATE_SMOOTHING) * self._rate if self._rate else rate
+                self._last_update_ns = now
+        
         if description:
             self.description = description
         self._display_progress()
     
     def _display_progress(self):
         """Display the progress bar."""
-        if self.total == 0:
+        if not self._tenths_divisor:
             return
-            
-        percent = (self.current / self.total) * 100
-        bar_length = 40
-        filled_length = int(bar_length * self.current // self.total)
         
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        elapsed = time.time() - self.start_time
+        total = self._total
+        now = time.monotonic_ns()
+        elapsed_ns = now - self.start_time_ns
         
-        if self.current > 0:
-            eta = (elapsed / self.current) * (self.total - self.current)
-            eta_str = f" ETA: {int(eta)}s" if eta > 1 else ""
-        else:
-            eta_str = ""
+        # Nothing visible changed since the last frame
+        frame_key = (self.current, self.description, elapsed_ns // NS_PER_SECOND)
+        if frame_key == self._last_frame_key:
+            return
         
-        # Clear line and print progress
-        sys.stdout.write(f'\r{self.description}: |{bar}| {self.current}/{self.total} ({percent:.1f}%){eta_str}')
-        sys.stdout.flush()
+        if (self._last_draw is not None and self.current < total and
+                now - self._last_draw < self._frame_interval_ns):
+            return
+        self._last_draw = now
+        self._last_frame_key = frame_key
+        
+        # Integer math, rounded to the nearest tenth of a percent
+        tenths = (self.current * 2000 + total) // self._tenths_divisor
         
-        if self.current >= self.total:
-            print()  # New line when complete
+        if not self._tty:
+            self._out.write(json.dumps({
+                'description': self.description,
+                'current': self.current,
+                'total': total,
+                'percent': tenths / 10,
+            }) + '\n')
+            self._out.flush()
+            return
+        
+        percent = _PCT_CACHE[tenths] if 0 <= tenths <= 1000 else f"{tenths / 10:.1f}%"
+        
+        filled_length = max(0, min(self.current * BAR_LENGTH // total, BAR_LENGTH))
+        bar = _BAR_CACHE[filled_length]
+        
+        # The ETA label is reused until progress moves or another second passes
+        eta_key = (self.current, elapsed_ns // NS_PER_SECOND)
+        if eta_key != self._eta_cache_key:
+            self._eta_cache_key = eta_key
+            if self.current > 0:
+                remaining = total - self.current
+                if self._rate > 0:
+                    eta = remaining / self._rate
+                else:
+                    # No rate sampled yet (progress set directly): average since the start
+                    eta = elapsed_ns * remaining / (self.current * NS_PER_SECOND)
+                self._eta_cache_val = f" ETA: {int(eta)}s" if eta > 1 else ""
+            else:
+                self._eta_cache_val = ""
+        eta_str = self._eta_cache_val
+        
+        # Clear line and print progress
+        self._out.write(f'\r{self.description}: |{bar}| {self.current}/{total} ({percent}){eta_str}')
+        if self.current >= total:
+            self._out.write('\n')  # New line when complete, on the same stream as the bar
+        self._out.flush()
     
     def finish(self, description: str = "Complete"):
         """Mark progress as finished."""
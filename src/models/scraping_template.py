@@ -34,6 +34,7 @@ class ElementSelector(BaseModel):
     is_container: bool = Field(default=False, description="Whether this is a repeating container element")
     use_find_similar: bool = Field(default=False, description="Use Scrapling's find_similar() method")
     sub_elements: List[SubElement] = Field(default_factory=list, description="Sub-elements to extract from each container")
+    sub_elements_ordered: bool = Field(default=False, description="Sub-elements appear in document order, allowing a single pass per container")
     
     # Subpage following
     follow_links: bool = Field(default=False, description="Follow links found in this element")
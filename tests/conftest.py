@@ -5,7 +5,11 @@ Pytest configuration and shared fixtures for the Interactive Web Scraper test su
 This module provides common fixtures and test utilities used across all test modules.
 """
 
+import os
+import shutil
+import tempfile
 import pytest
+from pathlib import Path
 from unittest.mock import Mock, MagicMock
 from typing import Dict, Any, List
 
@@ -192,6 +196,23 @@ def mock_fetcher():
     return MockFetcher()
 
 
+@pytest.fixture(scope="session")
+def fast_tmp(tmp_path_factory):
+    """
+    Session directory for file round-trip tests, on tmpfs when available.
+    
+    Uses /dev/shm on Linux to keep small-file I/O off real disk, otherwise
+    falls back to a pytest-managed temporary directory.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        base = Path(tempfile.mkdtemp(prefix="scraper_tests_", dir=shm))
+        yield base
+        shutil.rmtree(base, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("fast_tmp")
+
+
 def create_mock_elements(count: int, text_prefix: str = "Item") -> List[Mock]:
     """
     Utility function to create a list of mock elements.
@@ -251,8 +272,11 @@ def create_sample_container_data_factory():
 
 # Test markers for categorizing tests
 def pytest_configure(config):
-    """Configure custom pytest markers."""
+    """Configure custom pytest markers and warm the pagination handler import."""
     config.addinivalue_line("markers", "unit: marks tests as unit tests")
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
     config.addinivalue_line("markers", "slow: marks tests as slow running")
-    config.addinivalue_line("markers", "network: marks tests that require network access")
\ No newline at end of file
+    config.addinivalue_line("markers", "network: marks tests that require network access")
+    
+    # Import the pagination handler once per process (and per xdist worker) at startup
+    import src.core.handlers.pagination_handler  # noqa: F401
\ No newline at end of file
@@ -9,7 +9,12 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from typing import List, Dict, Any
 
-from src.core.extractors.data_extractor import DataExtractor
+from src.core.extractors.data_extractor import (
+    DataExtractor,
+    SLOTTED_ROW_THRESHOLD,
+    container_row_class,
+    simple_selector_predicate
+)
 from src.core.context import ScrapingContext
 from src.models.scraping_template import (
     ScrapingTemplate, 
@@ -269,11 +274,9 @@ class TestDataExtractor:
         element_config.element_type = 'text'
         
         mock_elements = [Mock(), Mock(), Mock()]
-        mock_elements[0].text = "Text1"
+        mock_elements[0].text = " Text1 "
         mock_elements[1].text = "Text2" 
-        mock_elements[2].text = ""  # Empty text should be filtered
-        
-        extractor.extract_single_element = Mock(side_effect=["Text1", "Text2", None])
+        mock_elements[2].text = None  # Unreadable text should be skipped
         
         result = extractor.extract_multiple_elements(mock_elements, element_config)
         
@@ -341,6 +344,155 @@ class TestDataExtractor:
         expected = [{"name": None, "_container_index": 0}]
         assert result == expected
 
+    def test_extract_container_data_ordered_single_pass(self, extractor, mock_page):
+        """Test that ordered sub-elements are matched from one union query."""
+        element_config = Mock(spec=ElementSelector)
+        element_config.selector = ".profile-card"
+        element_config.sub_elements_ordered = True
+        element_config.sub_elements = [
+            {"label": "name", "selector": "h3", "element_type": "text"},
+            {"label": "title", "selector": ".position", "element_type": "text"}
+        ]
+
+        name_node = Mock(tag="h3", attrib={})
+        title_node = Mock(tag="span", attrib={"class": "position muted"})
+        mock_container = Mock()
+        mock_container.css.return_value = [name_node, title_node]
+        mock_page.css.return_value = [mock_container]
+
+        extractor.extract_element_value = Mock(side_effect=["John Doe", "Partner"])
+
+        result = extractor.extract_container_data(element_config)
+
+        assert result == [{"name": "John Doe", "title": "Partner", "_container_index": 0}]
+        mock_container.css.assert_called_once_with("h3, .position")
+        extractor.extract_element_value.assert_any_call(title_node, "text")
+
+    def test_extract_container_data_ordered_falls_back_for_missing(self, extractor, mock_page):
+        """Test that sub-elements missed by the ordered walk are queried individually."""
+        element_config = Mock(spec=ElementSelector)
+        element_config.selector = ".profile-card"
+        element_config.sub_elements_ordered = True
+        element_config.sub_elements = [
+            {"label": "name", "selector": "h3", "element_type": "text"},
+            {"label": "title", "selector": ".position", "element_type": "text"}
+        ]
+
+        title_node = Mock(tag="span", attrib={"class": "position"})
+        mock_container = Mock()
+        mock_container.css.side_effect = [[title_node], [], [title_node]]
+        mock_page.css.return_value = [mock_container]
+
+        extractor.extract_element_value = Mock(return_value="Partner")
+
+        result = extractor.extract_container_data(element_config)
+
+        assert result == [{"name": None, "title": "Partner", "_container_index": 0}]
+        assert mock_container.css.call_count == 3
+
+    def test_simple_selector_predicate(self):
+        """Test compiling simple selectors into node predicates."""
+        assert simple_selector_predicate("div > a") is None
+        assert simple_selector_predicate("a[href*='mailto']") is None
+
+        predicate = simple_selector_predicate("span.position")
+        assert predicate(Mock(tag="span", attrib={"class": "muted position"}))
+        assert not predicate(Mock(tag="div", attrib={"class": "position"}))
+        assert simple_selector_predicate("#bio")(Mock(tag="p", attrib={"id": "bio"}))
+
+    def test_iter_container_data_is_lazy(self, extractor, mock_page):
+        """Test that container rows are extracted one container at a time."""
+        element_config = Mock(spec=ElementSelector)
+        element_config.selector = ".profile-card"
+        element_config.sub_elements = [
+            {"label": "name", "selector": "h3", "element_type": "text"}
+        ]
+
+        mock_container1 = Mock()
+        mock_container2 = Mock()
+        mock_container1.css.return_value = [Mock()]
+        mock_container2.css.return_value = [Mock()]
+        mock_page.css.return_value = [mock_container1, mock_container2]
+
+        extractor.extract_element_value = Mock(side_effect=["John Doe", "Jane Smith"])
+
+        rows = extractor._iter_container_data(element_config)
+        mock_page.css.assert_not_called()
+
+        assert next(rows) == {"name": "John Doe", "_container_index": 0}
+        mock_container2.css.assert_not_called()
+
+        assert list(rows) == [{"name": "Jane Smith", "_container_index": 1}]
+        assert next(rows, None) is None
+
+    def test_extract_container_data_large_page_returns_dicts(self, extractor, mock_page):
+        """Test that large container pages still return plain dict rows."""
+        element_config = Mock(spec=ElementSelector)
+        element_config.selector = ".profile-card"
+        element_config.sub_elements = [
+            {"label": "name", "selector": "h3", "element_type": "text"}
+        ]
+
+        containers = [Mock() for _ in range(SLOTTED_ROW_THRESHOLD + 1)]
+        for container in containers:
+            container.css.return_value = [Mock()]
+        mock_page.css.return_value = containers
+
+        extractor.extract_element_value = Mock(return_value="John Doe")
+
+        with patch('src.core.extractors.data_extractor.container_row_class',
+                   wraps=container_row_class) as row_class:
+            result = extractor.extract_container_data(element_config)
+
+        row_class.assert_called_once_with(("name",))
+        assert len(result) == SLOTTED_ROW_THRESHOLD + 1
+        assert all(type(row) is dict for row in result)
+        assert result[1] == {"name": "John Doe", "_container_index": 1}
+        assert result[1]["name"] == "John Doe"
+
+    def test_large_container_page_rows_merge_subpage_data(self, extractor, mock_page):
+        """Test that rows from a large container page accept merged subpage fields."""
+        element_config = Mock(spec=ElementSelector)
+        element_config.selector = ".profile-card"
+        element_config.sub_elements = [
+            {"label": "name", "selector": "h3", "element_type": "text"}
+        ]
+
+        count = SLOTTED_ROW_THRESHOLD + 1
+        containers = [Mock() for _ in range(count)]
+        for container in containers:
+            container.css.return_value = [Mock()]
+        mock_page.css.return_value = containers
+
+        extractor.extract_element_value = Mock(side_effect=[f"Lawyer {i}" for i in range(count)])
+
+        main_rows = extractor.extract_container_data(element_config)
+        for row in main_rows:
+            row["_profile_link"] = f"/lawyer/{row['_container_index']}"
+
+        subpage_rows = [
+            {"education": f"School {i}", "_container_index": i, "_profile_link": f"/lawyer/{i}"}
+            for i in range(count)
+        ]
+
+        result = extractor.merge_related_containers({
+            "main_profiles": main_rows,
+            "subpage_education": subpage_rows
+        })
+
+        assert len(result["main_profiles"]) == count
+        assert result["main_profiles"][-1]["name"] == f"Lawyer {count - 1}"
+        assert result["main_profiles"][-1]["education"] == f"School {count - 1}"
+        assert "subpage_education" not in result
+
+    def test_container_row_class_rejects_invalid_labels(self):
+        """Test that labels which are not identifiers or are reserved fall back to dicts."""
+        assert container_row_class(("full name",)) is None
+        assert container_row_class(("name", "name")) is None
+        assert container_row_class(("class",)) is None
+        assert container_row_class(("_profile_link",)) is None
+        assert container_row_class(("name",)) is container_row_class(("name",))
+
     def test_try_automatch_selector_css(self, extractor, mock_page):
         """Test AutoMatch with CSS selector."""
         element = Mock(spec=ElementSelector)
@@ -4,10 +4,12 @@ Test suite for data models and validation.
 """
 
 import pytest
-import json
-from datetime import datetime
-from pathlib import Path
-import tempfile
+from uuid import uuid4
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 from src.models.scraping_template import (
     ElementSelector, 
@@ -18,113 +20,94 @@ from src.models.scraping_template import (
 )
 
 
-class TestElementSelector:
-    """Test cases for ElementSelector model."""
-    
-    def test_valid_element_selector(self):
-        """Test creating a valid element selector."""
-        selector = ElementSelector(
-            label="test_element",
-            selector=".test-class",
-            selector_type="css",
-            element_type="text"
-        )
-        
-        assert selector.label == "test_element"
-        assert selector.selector == ".test-class"
-        assert selector.selector_type == "css"
-        assert selector.element_type == "text"
-        assert selector.is_multiple == False
-        assert selector.is_required == True
-    
-    def test_invalid_selector_type(self):
-        """Test validation of selector type."""
-        with pytest.raises(ValueError):
+@pytest.fixture(scope="session", autouse=True)
+def _warm_models():
+    """Construct each model once so first-use validator setup happens outside the tests."""
+    ElementSelector(label="_w", selector="_", selector_type="css", element_type="text")
+    CookieData(name="_w", value="_", domain=".")
+    NavigationAction(label="_w", selector="_", action_type="click")
+    ScrapingTemplate(name="_w", url="https://example.com")
+    ScrapingResult(template_name="_w", url="https://example.com", success=True)
+
+
+@pytest.fixture(scope="module")
+def sample_template():
+    """Shared read-only template; tests must not mutate it."""
+    return ScrapingTemplate(
+        name="test_template",
+        url="https://example.com",
+        elements=[
             ElementSelector(
-                label="test",
-                selector=".test",
-                selector_type="invalid",
+                label="title",
+                selector="h1",
                 element_type="text"
             )
-    
-    def test_invalid_element_type(self):
-        """Test validation of element type."""
-        with pytest.raises(ValueError):
-            ElementSelector(
-                label="test",
-                selector=".test",
-                selector_type="css",
-                element_type="invalid"
-            )
+        ]
+    )
 
 
-class TestCookieData:
-    """Test cases for CookieData model."""
-    
-    def test_valid_cookie(self):
-        """Test creating a valid cookie."""
-        cookie = CookieData(
-            name="session_id",
-            value="abc123",
-            domain=".example.com",
-            secure=True
-        )
-        
-        assert cookie.name == "session_id"
-        assert cookie.value == "abc123"
-        assert cookie.domain == ".example.com"
-        assert cookie.secure == True
-        assert cookie.path == "/"
+@pytest.fixture(scope="module")
+def sample_result():
+    """Shared read-only result; tests must not mutate it."""
+    return ScrapingResult(
+        template_name="test_template",
+        url="https://example.com",
+        success=True,
+        data={"title": "Test Title"}
+    )
 
 
-class TestNavigationAction:
-    """Test cases for NavigationAction model."""
+class TestModelConstruction:
+    """Test cases for constructing and validating the simple models."""
     
-    def test_valid_action(self):
-        """Test creating a valid navigation action."""
-        action = NavigationAction(
-            label="next_page",
-            selector=".next-btn",
-            action_type="click",
-            wait_after=2.0
-        )
+    @pytest.mark.parametrize("cls,kwargs,checks", [
+        (
+            ElementSelector,
+            {"label": "test_element", "selector": ".test-class", "selector_type": "css", "element_type": "text"},
+            [("label", "test_element"), ("selector", ".test-class"), ("selector_type", "css"),
+             ("element_type", "text"), ("is_multiple", False), ("is_required", True),
+             ("sub_elements_ordered", False)]
+        ),
+        (
+            CookieData,
+            {"name": "session_id", "value": "abc123", "domain": ".example.com", "secure": True},
+            [("name", "session_id"), ("value", "abc123"), ("domain", ".example.com"),
+             ("secure", True), ("path", "/")]
+        ),
+        (
+            NavigationAction,
+            {"label": "next_page", "selector": ".next-btn", "action_type": "click", "wait_after": 2.0},
+            [("label", "next_page"), ("selector", ".next-btn"), ("action_type", "click"),
+             ("wait_after", 2.0)]
+        ),
+    ], ids=["element_selector", "cookie", "navigation_action"])
+    def test_valid_model(self, cls, kwargs, checks):
+        """Test creating valid models and their defaults."""
+        obj = cls(**kwargs)
         
-        assert action.label == "next_page"
-        assert action.selector == ".next-btn"
-        assert action.action_type == "click"
-        assert action.wait_after == 2.0
+        for attribute, expected in checks:
+            assert getattr(obj, attribute) == expected
     
-    def test_invalid_action_type(self):
-        """Test validation of action type."""
+    @pytest.mark.parametrize("cls,kwargs", [
+        (ElementSelector, {"label": "test", "selector": ".test", "selector_type": "invalid", "element_type": "text"}),
+        (ElementSelector, {"label": "test", "selector": ".test", "selector_type": "css", "element_type": "invalid"}),
+        (NavigationAction, {"label": "test", "selector": ".test", "action_type": "invalid"}),
+    ], ids=["selector_type", "element_type", "action_type"])
+    def test_invalid_model(self, cls, kwargs):
+        """Test validation of enumerated model fields."""
         with pytest.raises(ValueError):
-            NavigationAction(
-                label="test",
-                selector=".test",
-                action_type="invalid"
-            )
+            cls(**kwargs)
 
 
 class TestScrapingTemplate:
     """Test cases for ScrapingTemplate model."""
     
-    def test_valid_template(self):
+    def test_valid_template(self, sample_template):
         """Test creating a valid scraping template."""
-        template = ScrapingTemplate(
-            name="test_template",
-            url="https://example.com",
-            elements=[
-                ElementSelector(
-                    label="title",
-                    selector="h1",
-                    element_type="text"
-                )
-            ]
-        )
-        
-        assert template.name == "test_template"
-        assert template.url == "https://example.com"
-        assert len(template.elements) == 1
-        assert template.elements[0].label == "title"
+        assert sample_template.name == "test_template"
+        assert sample_template.url == "https://example.com"
+        assert len(sample_template.elements) == 1
+        assert sample_template.elements[0].label == "title"
     
     def test_invalid_url(self):
         """Test validation of URL."""
@@ -134,56 +117,29 @@ class TestScrapingTemplate:
                 url="not-a-url"
             )
     
-    def test_template_json_serialization(self):
+    def test_template_json_serialization(self, sample_template):
         """Test JSON serialization of template."""
-        template = ScrapingTemplate(
-            name="test_template",
-            url="https://example.com",
-            elements=[
-                ElementSelector(
-                    label="title",
-                    selector="h1",
-                    element_type="text"
-                )
-            ]
-        )
-        
-        json_str = template.to_json()
+        json_str = sample_template.to_json()
         assert isinstance(json_str, str)
         
         # Verify it's valid JSON
-        parsed = json.loads(json_str)
+        parsed = _loads(json_str)
         assert parsed["name"] == "test_template"
         assert parsed["url"] == "https://example.com"
     
-    def test_template_file_operations(self):
+    def test_template_file_operations(self, sample_template, fast_tmp):
         """Test saving and loading template from file."""
-        template = ScrapingTemplate(
-            name="test_template",
-            url="https://example.com",
-            elements=[
-                ElementSelector(
-                    label="title",
-                    selector="h1",
-                    element_type="text"
-                )
-            ]
-        )
-        
         # Test saving to file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            template.save_to_file(f.name)
-            
-            # Test loading from file
-            loaded_template = ScrapingTemplate.load_from_file(f.name)
-            
-            assert loaded_template.name == template.name
-            assert loaded_template.url == template.url
-            assert len(loaded_template.elements) == len(template.elements)
-            assert loaded_template.elements[0].label == template.elements[0].label
-            
-            # Cleanup
-            Path(f.name).unlink()
+        path = fast_tmp / f"tpl_{uuid4().hex}.json"
+        sample_template.save_to_file(str(path))
+        
+        # Test loading from file
+        loaded_template = ScrapingTemplate.load_from_file(str(path))
+        
+        assert loaded_template.name == sample_template.name
+        assert loaded_template.url == sample_template.url
+        assert len(loaded_template.elements) == len(sample_template.elements)
+        assert loaded_template.elements[0].label == sample_template.elements[0].label
     
     def test_get_element_by_label(self):
         """Test getting element by label."""
@@ -211,6 +167,8 @@ class TestScrapingResult:
     
     def test_valid_result(self):
         """Test creating a valid scraping result."""
+        from datetime import datetime
+        
         result = ScrapingResult(
             template_name="test_template",
             url="https://example.com",
@@ -226,43 +184,25 @@ class TestScrapingResult:
         assert result.metadata == {"elements_found": 1}
         assert isinstance(result.scraped_at, datetime)
     
-    def test_result_json_serialization(self):
+    def test_result_json_serialization(self, sample_result):
         """Test JSON serialization of result."""
-        result = ScrapingResult(
-            template_name="test_template",
-            url="https://example.com",
-            success=True,
-            data={"title": "Test Title"}
-        )
-        
-        json_str = result.to_json()
+        json_str = sample_result.to_json()
         assert isinstance(json_str, str)
         
         # Verify it's valid JSON
-        parsed = json.loads(json_str)
+        parsed = _loads(json_str)
         assert parsed["template_name"] == "test_template"
         assert parsed["success"] == True
     
-    def test_result_file_operations(self):
+    def test_result_file_operations(self, sample_result, fast_tmp):
         """Test saving result to file."""
-        result = ScrapingResult(
-            template_name="test_template",
-            url="https://example.com",
-            success=True,
-            data={"title": "Test Title"}
-        )
+        path = fast_tmp / f"result_{uuid4().hex}.json"
+        sample_result.save_to_file(str(path))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            result.save_to_file(f.name)
-            
-            # Verify file was created and contains valid JSON
-            with open(f.name, 'r') as read_file:
-                data = json.load(read_file)
-                assert data["template_name"] == "test_template"
-                assert data["success"] == True
-            
-            # Cleanup
-            Path(f.name).unlink()
+        # Verify file was created and contains valid JSON
+        data = _loads(path.read_bytes())
+        assert data["template_name"] == "test_template"
+        assert data["success"] == True
 
 
 if __name__ == "__main__":
@@ -5,29 +5,87 @@ Comprehensive unit tests for PaginationHandler module.
 Tests for pagination detection, infinite scroll, load-more buttons, and URL-based pagination.
 """
 
+import copy
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-from typing import Dict, Any, List
-from urllib.parse import urlparse, parse_qs
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec, patch
 
 from src.core.handlers.pagination_handler import PaginationHandler
 from src.core.context import ScrapingContext
 from src.models.scraping_template import ScrapingTemplate
 
 
+# Stand-in page element; the handler only checks truthiness and len() of matches.
+_EL = object()
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """
+    Turn time.sleep into a no-op for each test.
+    
+    The handler module holds a reference to the time module, so this patches
+    time.sleep process-wide, not just inside the handler.
+    """
+    monkeypatch.setattr("src.core.handlers.pagination_handler.time.sleep", lambda *_args, **_kwargs: None)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_progress():
+    """Replace the handler's ProgressTracker with one MagicMock for the whole module."""
+    with patch('src.core.handlers.pagination_handler.ProgressTracker') as progress:
+        yield progress
+
+
+_NO_DEFAULT = object()
+
+
+def _returns(values, default=_NO_DEFAULT):
+    """
+    Return each of ``values`` in turn; a cheap stand-in for ``Mock(side_effect=[...])``.
+    
+    Once ``values`` runs out, further calls return ``default``, or raise
+    StopIteration like a Mock would if no default is given.
+    """
+    remaining = iter(values)
+    if default is _NO_DEFAULT:
+        return lambda *_args, **_kwargs: next(remaining)
+    return lambda *_args, **_kwargs: next(remaining, default)
+
+
 class TestPaginationHandler:
-    """Test cases for PaginationHandler functionality."""
+    """
+    Test cases for PaginationHandler functionality.
+    
+    The session-scoped context skeleton is built once per pytest-xdist
+    worker, so the tests can be spread with ``pytest -n auto --dist load``.
+    """
+
+    @pytest.fixture(scope="session")
+    def _context_template(self):
+        """Build the autospecced ScrapingContext skeleton once for the whole session."""
+        context = create_autospec(ScrapingContext, instance=True)
+        context.session_logger = Mock()
+        context.current_page = None
+        context.template = create_autospec(ScrapingTemplate, instance=True)
+        context.fetcher = Mock()
+        return context
 
     @pytest.fixture
-    def mock_context(self):
-        """Create a mock ScrapingContext for testing."""
-        context = Mock(spec=ScrapingContext)
-        context.session_logger = Mock()
+    def mock_context(self, _context_template):
+        """
+        Reset the shared mock ScrapingContext for a test.
+        
+        reset_mock() clears calls, return values and side effects, but not
+        attributes assigned by a test. Only current_page, template.url and
+        template.pagination are restored here, so tests must not assign any
+        other attribute on the context.
+        """
+        context = _context_template
+        context.reset_mock(return_value=True, side_effect=True)
         context.current_page = Mock()
-        context.template = Mock(spec=ScrapingTemplate)
         context.template.url = "https://example.com/people"
         context.template.pagination = None
-        context.fetcher = Mock()
         return context
 
     @pytest.fixture
@@ -38,70 +96,53 @@ class TestPaginationHandler:
         page.xpath = Mock()
         return page
 
-    @pytest.fixture
-    def mock_pagination_config(self):
-        """Create a mock pagination configuration."""
-        pagination = Mock()
-        pagination.next_selector = ".next-page"
-        pagination.load_more_selector = ".load-more"
-        pagination.page_selector = ".page-number"
-        pagination.pattern_type = "button"
-        pagination.scroll_pause_time = 2
-        pagination.max_pages = 10
-        pagination.end_condition_selector = ".end-marker"
-        return pagination
+    @pytest.fixture(scope="session")
+    def _baseline_handler(self, _context_template):
+        """Build one PaginationHandler bound to the shared context skeleton."""
+        return PaginationHandler(_context_template)
 
     @pytest.fixture
-    def handler(self, mock_context, mock_page):
+    def handler(self, _baseline_handler, mock_context, mock_page):
         """Create PaginationHandler instance with mock context and page."""
         mock_context.current_page = mock_page
-        return PaginationHandler(mock_context)
-
-    def test_has_pagination_actions_defined_with_selectors(self, handler, mock_context, mock_pagination_config):
-        """Test pagination actions detection with defined selectors."""
-        mock_context.template.pagination = mock_pagination_config
-        
-        result = handler._has_pagination_actions_defined()
-        
-        assert result is True
-
-    def test_has_pagination_actions_defined_no_pagination(self, handler, mock_context):
-        """Test pagination actions detection with no pagination config."""
-        mock_context.template.pagination = None
-        
-        result = handler._has_pagination_actions_defined()
         
-        assert result is False
-
-    def test_has_pagination_actions_defined_infinite_scroll_with_config(self, handler, mock_context):
-        """Test pagination actions detection for infinite scroll with configuration."""
-        pagination = Mock()
-        pagination.next_selector = None
-        pagination.load_more_selector = None
-        pagination.page_selector = None
-        pagination.pattern_type = "infinite_scroll"
-        pagination.scroll_pause_time = 2
-        pagination.max_pages = 50
-        pagination.end_condition_selector = ".no-more-content"
+        # template and fetcher are the skeleton's own mocks, so only rebind per-test state
+        handler = copy.copy(_baseline_handler)
+        handler.context = mock_context
+        handler.current_page = mock_page
+        return handler
+
+    @pytest.mark.parametrize(
+        "next_sel,load_more_sel,page_sel,pattern_type,scroll_pause,max_pages,end_sel,expected",
+        [
+            (".next-page", ".load-more", ".page-number", "button", 2, 10, ".end-marker", True),
+            (None, None, None, "infinite_scroll", 2, 50, ".no-more-content", True),
+            (None, None, None, "infinite_scroll", None, None, None, False),
+        ],
+        ids=["with_selectors", "infinite_scroll_with_config", "infinite_scroll_no_config"]
+    )
+    def test_has_pagination_actions_defined(self, handler, mock_context, next_sel, load_more_sel, page_sel,
+                                            pattern_type, scroll_pause, max_pages, end_sel, expected):
+        """Test pagination actions detection across pagination configurations."""
+        pagination = SimpleNamespace(
+            next_selector=next_sel,
+            load_more_selector=load_more_sel,
+            page_selector=page_sel,
+            pattern_type=pattern_type,
+            scroll_pause_time=scroll_pause,
+            max_pages=max_pages,
+            end_condition_selector=end_sel
+        )
         
         mock_context.template.pagination = pagination
         
         result = handler._has_pagination_actions_defined()
         
-        assert result is True
+        assert result is expected
 
-    def test_has_pagination_actions_defined_infinite_scroll_no_config(self, handler, mock_context):
-        """Test pagination actions detection for infinite scroll without configuration."""
-        pagination = Mock()
-        pagination.next_selector = None
-        pagination.load_more_selector = None
-        pagination.page_selector = None
-        pagination.pattern_type = "infinite_scroll"
-        pagination.scroll_pause_time = None
-        pagination.max_pages = None
-        pagination.end_condition_selector = None
-        
-        mock_context.template.pagination = pagination
+    def test_has_pagination_actions_defined_no_pagination(self, handler, mock_context):
+        """Test pagination actions detection with no pagination config."""
+        mock_context.template.pagination = None
         
         result = handler._has_pagination_actions_defined()
         
@@ -144,72 +185,51 @@ class TestPaginationHandler:
     def test_auto_scroll_to_load_all_content_success(self, handler, mock_page):
         """Test successful auto-scroll content loading."""
         handler.count_profile_elements = Mock(side_effect=[10, 15, 20, 20, 20])  # Content loading then stable
-        handler.try_load_more_buttons = Mock(side_effect=[True, True, False])  # Success, success, then failure
+        handler.try_load_more_buttons = _returns([True, True, False])  # Success, success, then failure
         handler.try_scrapling_scroll = Mock(return_value=False)
         handler.try_pagination_load = Mock(return_value=False)
         
-        with patch('src.core.handlers.pagination_handler.ProgressTracker') as mock_progress:
-            mock_progress_instance = Mock()
-            mock_progress.return_value = mock_progress_instance
-            
-            with patch('time.sleep'):  # Mock sleep to speed up test
-                handler.auto_scroll_to_load_all_content()
-                
-                # Should have stopped after 3 stable counts
-                assert handler.count_profile_elements.call_count >= 4
+        handler.auto_scroll_to_load_all_content()
+        
+        # Should have stopped after 3 stable counts
+        assert handler.count_profile_elements.call_count >= 4
 
     def test_auto_scroll_to_load_all_content_no_initial_profiles(self, handler, mock_page):
         """Test auto-scroll when no initial profiles are found."""
         handler.count_profile_elements = Mock(return_value=0)
         
-        with patch('src.core.handlers.pagination_handler.ProgressTracker'):
-            handler.auto_scroll_to_load_all_content()
-            
-            # Should exit early without attempting scrolls
-            handler.count_profile_elements.assert_called_once()
-
-    def test_try_load_more_buttons_found(self, handler, mock_page):
-        """Test successful load more button detection."""
-        mock_page.css.side_effect = [
-            [],  # No button with first pattern
-            [Mock()],  # Button found with second pattern
-        ]
-        
-        result = handler.try_load_more_buttons()
+        handler.auto_scroll_to_load_all_content()
         
-        assert result is True
+        # Should exit early without attempting scrolls
+        handler.count_profile_elements.assert_called_once()
 
-    def test_try_load_more_buttons_not_found(self, handler, mock_page):
-        """Test when no load more buttons are found."""
-        mock_page.css.return_value = []
+    @pytest.mark.parametrize("css_results,expected", [
+        ([[], [_EL]], True),  # Button found with second pattern
+        ([], False),
+    ], ids=["found", "not_found"])
+    def test_try_load_more_buttons(self, handler, mock_page, css_results, expected):
+        """Test load more button detection."""
+        mock_page.css.side_effect = _returns(css_results, default=[])
         
         result = handler.try_load_more_buttons()
         
-        assert result is False
-
-    def test_try_pagination_load_found(self, handler, mock_page):
-        """Test successful pagination detection."""
-        mock_page.css.side_effect = [
-            [Mock()],  # Pagination found with first pattern
-        ]
-        
-        result = handler.try_pagination_load()
-        
-        assert result is True
+        assert result is expected
 
-    def test_try_pagination_load_not_found(self, handler, mock_page):
-        """Test when no pagination is found."""
-        mock_page.css.return_value = []
+    @pytest.mark.parametrize("css_results,expected", [
+        ([[_EL]], True),  # Pagination found with first pattern
+        ([], False),
+    ], ids=["found", "not_found"])
+    def test_try_pagination_load(self, handler, mock_page, css_results, expected):
+        """Test pagination detection."""
+        mock_page.css.side_effect = _returns(css_results, default=[])
         
         result = handler.try_pagination_load()
         
-        assert result is False
+        assert result is expected
 
     def test_handle_pagination_button_type(self, handler, mock_context, mock_page):
         """Test pagination handling for button type."""
-        pagination = Mock()
-        pagination.pattern_type = "button"
-        pagination.next_selector = ".next-btn"
+        pagination = SimpleNamespace(pattern_type="button", next_selector=".next-btn")
         
         mock_context.template.pagination = pagination
         
@@ -221,39 +241,28 @@ class TestPaginationHandler:
         
         assert result is True
 
-    def test_handle_pagination_infinite_scroll_type(self, handler, mock_context):
-        """Test pagination handling for infinite scroll type."""
-        pagination = Mock()
-        pagination.pattern_type = "infinite_scroll"
+    @pytest.mark.parametrize("pattern_type,handler_attr", [
+        ("infinite_scroll", "handle_infinite_scroll"),
+        ("load_more", "handle_load_more_pagination"),
+    ])
+    def test_handle_pagination_delegates(self, handler, mock_context, pattern_type, handler_attr):
+        """Test pagination handling delegates by pattern type."""
+        pagination = SimpleNamespace(pattern_type=pattern_type)
         
         mock_context.template.pagination = pagination
-        handler.handle_infinite_scroll = Mock(return_value=True)
+        setattr(handler, handler_attr, Mock(return_value=True))
         
         result = handler.handle_pagination()
         
         assert result is True
-        handler.handle_infinite_scroll.assert_called_once()
-
-    def test_handle_pagination_load_more_type(self, handler, mock_context):
-        """Test pagination handling for load more type."""
-        pagination = Mock()
-        pagination.pattern_type = "load_more"
-        
-        mock_context.template.pagination = pagination
-        handler.handle_load_more_pagination = Mock(return_value=True)
-        
-        result = handler.handle_pagination()
-        
-        assert result is True
-        handler.handle_load_more_pagination.assert_called_once()
+        getattr(handler, handler_attr).assert_called_once()
 
     def test_handle_infinite_scroll_with_end_condition(self, handler, mock_context, mock_page):
         """Test infinite scroll handling with end condition met."""
-        pagination = Mock()
-        pagination.end_condition_selector = ".end-marker"
+        pagination = SimpleNamespace(end_condition_selector=".end-marker")
         
         mock_context.template.pagination = pagination
-        mock_page.css.return_value = [Mock()]  # End condition element found
+        mock_page.css.return_value = [_EL]  # End condition element found
         
         result = handler.handle_infinite_scroll()
         
@@ -261,8 +270,7 @@ class TestPaginationHandler:
 
     def test_handle_infinite_scroll_continue(self, handler, mock_context, mock_page):
         """Test infinite scroll handling when should continue."""
-        pagination = Mock()
-        pagination.end_condition_selector = ".end-marker"
+        pagination = SimpleNamespace(end_condition_selector=".end-marker")
         
         mock_context.template.pagination = pagination
         mock_page.css.return_value = []  # No end condition element
@@ -278,19 +286,17 @@ class TestPaginationHandler:
         # Mock successful pattern detection
         handler.fetch_page = Mock(return_value=Mock())
         handler.has_different_content = Mock(return_value=True)
-        handler.extract_data = Mock(side_effect=[
+        # Pagination only ends after three consecutive empty pages
+        handler.extract_data = _returns([
             {"profiles": [{"name": "John"}]},
             {"profiles": [{"name": "Jane"}]},
-            {"profiles": []},  # Empty page to end pagination
-        ])
+        ], default={"profiles": []})
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            result = handler.try_url_based_pagination()
-            
-            assert result is not None
-            assert "profiles" in result
-            # Should have collected data from multiple pages
-            assert len(result["profiles"]) >= 1
+        result = handler.try_url_based_pagination()
+        
+        assert result is not None
+        # Should have collected data from multiple pages
+        assert result["profiles"] == [{"name": "John"}, {"name": "Jane"}]
 
     def test_try_url_based_pagination_no_working_pattern(self, handler, mock_context):
         """Test URL-based pagination when no pattern works."""
@@ -334,7 +340,7 @@ class TestPaginationHandler:
         handler.extract_data = Mock(return_value={"profiles": [{"name": "Current"}]})
         handler.try_standard_pagination = Mock(return_value={"profiles": [{"name": "Standard"}]})
         
-        mock_context.template.pagination = Mock()
+        mock_context.template.pagination = SimpleNamespace(pattern_type="button")
         
         result = handler.try_scroll_based_pagination()
         
@@ -343,22 +349,19 @@ class TestPaginationHandler:
     def test_try_standard_pagination_success(self, handler, mock_context):
         """Test standard pagination processing."""
         handler._has_pagination_actions_defined = Mock(return_value=True)
-        handler.extract_data = Mock(side_effect=[
+        handler.extract_data = _returns([
             {"profiles": [{"name": "Page1"}]},
             {"profiles": [{"name": "Page2"}]},
         ])
-        handler.handle_pagination = Mock(side_effect=[True, False])  # More content, then stop
+        handler.handle_pagination = _returns([True, False])  # More content, then stop
         
-        mock_context.template.pagination = Mock()
-        mock_context.template.pagination.max_pages = 5
-        mock_context.template.pagination.scroll_pause_time = 1
+        mock_context.template.pagination = SimpleNamespace(pattern_type="button", max_pages=5, scroll_pause_time=1)
         
-        with patch('time.sleep'):
-            result = handler.try_standard_pagination()
-            
-            assert "profiles" in result
-            assert len(result["profiles"]) == 2
-            assert result["profiles"] == [{"name": "Page1"}, {"name": "Page2"}]
+        result = handler.try_standard_pagination()
+        
+        assert "profiles" in result
+        assert len(result["profiles"]) == 2
+        assert result["profiles"] == [{"name": "Page1"}, {"name": "Page2"}]
 
     def test_try_standard_pagination_no_actions(self, handler, mock_context):
         """Test standard pagination when no actions defined."""
@@ -372,82 +375,69 @@ class TestPaginationHandler:
     def test_try_auto_load_more_pagination_success(self, handler, mock_page):
         """Test auto load more pagination with successful loading."""
         handler.extract_data = Mock(return_value={"main_container": [{"name": "Initial"}]})
-        handler.extract_data_incremental = Mock(side_effect=[
+        handler.extract_data_incremental = _returns([
             {"main_container": [{"name": "New1"}]},
             {"main_container": [{"name": "New2"}]},
             {"main_container": []},  # No more content
         ])
         
         mock_page.css.side_effect = [
-            [Mock()],  # Load more button exists
-            [Mock()],  # Button still exists
+            [_EL],  # Load more button exists
+            [_EL],  # Button still exists
             [],  # Button gone
         ]
         
-        with patch('time.sleep'):
-            result = handler.try_auto_load_more_pagination(".load-more")
-            
-            assert "main_container" in result
-            assert len(result["main_container"]) == 3  # Initial + 2 new items
+        result = handler.try_auto_load_more_pagination(".load-more")
+        
+        assert "main_container" in result
+        assert len(result["main_container"]) == 3  # Initial + 2 new items
 
     def test_try_wpgb_infinite_scroll_pagination_success(self, handler):
         """Test WPGB infinite scroll pagination."""
-        handler.extract_data = Mock(side_effect=[
+        handler.extract_data = _returns([
             {"main_container": [{"name": "Item1"}]},  # Initial
             {"main_container": [{"name": "Item1"}, {"name": "Item2"}]},  # After scroll 1
             {"main_container": [{"name": "Item1"}, {"name": "Item2"}]},  # No new content
             {"main_container": [{"name": "Item1"}, {"name": "Item2"}]},  # Still no new content
         ])
         
-        with patch('time.sleep'):
-            result = handler.try_wpgb_infinite_scroll_pagination()
-            
-            assert "main_container" in result
-            assert len(result["main_container"]) == 2
-
-    def test_auto_detect_load_more_buttons_found(self, handler, mock_page):
-        """Test successful auto-detection of load more buttons."""
-        mock_page.css.side_effect = [
-            [],  # First selector fails
-            [Mock()],  # Second selector succeeds
-        ]
-        
-        result = handler.auto_detect_load_more_buttons()
+        result = handler.try_wpgb_infinite_scroll_pagination()
         
-        assert result is not None
-        assert ".wpgb-pagination-facet a" in result
+        assert "main_container" in result
+        assert len(result["main_container"]) == 2
 
-    def test_auto_detect_load_more_buttons_not_found(self, handler, mock_page):
-        """Test when no load more buttons are detected."""
-        mock_page.css.return_value = []
+    @pytest.mark.parametrize("css_results,expected", [
+        ([[], [_EL]], ".wpgb-pagination-facet a"),  # Second selector succeeds
+        ([], None),
+    ], ids=["found", "not_found"])
+    def test_auto_detect_load_more_buttons(self, handler, mock_page, css_results, expected):
+        """Test auto-detection of load more buttons."""
+        mock_page.css.side_effect = _returns(css_results, default=[])
         
         result = handler.auto_detect_load_more_buttons()
         
-        assert result is None
+        if expected is None:
+            assert result is None
+        else:
+            assert expected in result
 
-    def test_detect_wpgb_infinite_scroll_found(self, handler, mock_page):
-        """Test successful WPGB infinite scroll detection."""
-        mock_page.css.side_effect = [
-            [Mock()],  # WPGB indicator found
-        ]
+    @pytest.mark.parametrize("css_results,expected", [
+        ([[_EL]], True),  # WPGB indicator found
+        ([], False),
+    ], ids=["found", "not_found"])
+    def test_detect_wpgb_infinite_scroll(self, handler, mock_page, css_results, expected):
+        """Test WPGB infinite scroll detection."""
+        mock_page.css.side_effect = _returns(css_results, default=[])
         
         result = handler.detect_wpgb_infinite_scroll()
         
-        assert result is True
-
-    def test_detect_wpgb_infinite_scroll_not_found(self, handler, mock_page):
-        """Test when WPGB infinite scroll is not detected."""
-        mock_page.css.return_value = []
-        
-        result = handler.detect_wpgb_infinite_scroll()
-        
-        assert result is False
+        assert result is expected
 
     def test_count_profile_elements_success(self, handler, mock_page):
         """Test successful profile element counting."""
         mock_page.css.side_effect = [
-            [Mock(), Mock(), Mock()],  # 3 elements with first selector
-            [Mock(), Mock(), Mock(), Mock(), Mock()],  # 5 elements with second selector
+            [_EL] * 3,  # 3 elements with first selector
+            [_EL] * 5,  # 5 elements with second selector
         ]
         
         result = handler.count_profile_elements()
@@ -462,25 +452,17 @@ class TestPaginationHandler:
         
         assert result == 0
 
-    def test_has_different_content_different(self, handler, mock_page):
-        """Test content difference detection when content differs."""
-        test_page = Mock()
+    @pytest.mark.parametrize("counts,expected", [
+        ([10, 15], True),
+        ([10, 10], False),
+    ], ids=["different", "same"])
+    def test_has_different_content(self, handler, mock_page, counts, expected):
+        """Test content difference detection from container counts."""
+        handler.get_container_count = _returns(counts)
         
-        handler.get_container_count = Mock(side_effect=[10, 15])  # Different counts
-        
-        result = handler.has_different_content(test_page)
+        result = handler.has_different_content(Mock())
         
-        assert result is True
-
-    def test_has_different_content_same(self, handler, mock_page):
-        """Test content difference detection when content is same."""
-        test_page = Mock()
-        
-        handler.get_container_count = Mock(side_effect=[10, 10])  # Same counts
-        
-        result = handler.has_different_content(test_page)
-        
-        assert result is False
+        assert result is expected
 
     def test_has_different_content_no_pages(self, handler):
         """Test content difference detection with missing pages."""
@@ -494,7 +476,7 @@ class TestPaginationHandler:
         """Test container counting with successful detection."""
         page = Mock()
         page.css.side_effect = [
-            [Mock() for _ in range(10)],  # 10 elements found
+            [_EL] * 10,  # 10 elements found
         ]
         
         result = handler.get_container_count(page)
@@ -505,7 +487,7 @@ class TestPaginationHandler:
         """Test container counting with insufficient content."""
         page = Mock()
         page.css.side_effect = [
-            [Mock(), Mock()],  # Only 2 elements (less than 5 threshold)
+            [_EL] * 2,  # Only 2 elements (less than 5 threshold)
             [],  # No elements
         ]
         
@@ -552,14 +534,13 @@ class TestPaginationHandler:
         handler.extract_data = Mock(return_value={"profiles": [{"name": "Test"}]})
         handler.handle_pagination = Mock(return_value=True)  # Always says more content available
         
-        mock_context.template.pagination = Mock()
-        mock_context.template.pagination.max_pages = 2  # Low limit for testing
+        # Low max_pages limit for testing
+        mock_context.template.pagination = SimpleNamespace(pattern_type="button", max_pages=2)
         
-        with patch('time.sleep'):
-            result = handler.try_standard_pagination()
-            
-            # Should stop at max_pages limit
-            assert handler.extract_data.call_count <= 3  # max_pages + 1 for safety
+        result = handler.try_standard_pagination()
+        
+        # Should stop at max_pages limit
+        assert handler.extract_data.call_count <= 3  # max_pages + 1 for safety
 
     def test_consecutive_failures_handling(self, handler):
         """Test handling of consecutive failures in pagination."""
@@ -567,14 +548,13 @@ class TestPaginationHandler:
         handler.extract_data_incremental = Mock(return_value=None)  # Always fails
         
         mock_page = Mock()
-        mock_page.css.return_value = [Mock()]  # Load more button always exists
+        mock_page.css.return_value = [_EL]  # Load more button always exists
         handler.current_page = mock_page
         
-        with patch('time.sleep'):
-            result = handler.try_auto_load_more_pagination(".load-more")
-            
-            # Should stop after consecutive failures
-            assert result["main_container"] == [{"name": "Initial"}]
+        result = handler.try_auto_load_more_pagination(".load-more")
+        
+        # Should stop after consecutive failures
+        assert result["main_container"] == [{"name": "Initial"}]
 
     def test_url_parsing_and_pagination_parameter_detection(self, handler, mock_context):
         """Test URL parsing and pagination parameter detection."""
@@ -5,12 +5,48 @@ Comprehensive unit tests for ProgressTracker module.
 Tests for progress tracking, ETA calculations, and terminal display.
 """
 
+import json
 import pytest
 import time
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
 from io import StringIO
 
-from src.core.utils.progress import ProgressTracker
+from src.core.utils import progress
+from src.core.utils.progress import NS_PER_SECOND, ProgressTracker
+
+
+class _TerminalBuffer(StringIO):
+    """In-memory stdout that reports itself as a terminal and counts flushes."""
+    
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+    
+    def isatty(self):
+        return True
+    
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+    
+    @property
+    def last_frame(self):
+        """Text written since the last carriage return."""
+        value = self.getvalue()
+        return value[value.rfind('\r'):]
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    """Capture progress output in a terminal-like StringIO.
+    
+    Pytest reinstalls its own sys.stdout before each test call, so the
+    buffer is handed to the progress module through its ``sys`` reference.
+    """
+    buffer = _TerminalBuffer()
+    monkeypatch.setattr(progress, 'sys', SimpleNamespace(stdout=buffer))
+    return buffer
 
 
 class TestProgressTracker:
@@ -33,8 +69,13 @@ class TestProgressTracker:
         assert tracker.current == 0
         assert tracker.description == "Progress"
 
-    @patch('sys.stdout')
-    def test_update_increment_default(self, mock_stdout):
+    def test_instances_have_no_dict(self):
+        """Test that trackers store their state in slots."""
+        tracker = ProgressTracker(10)
+        
+        assert not hasattr(tracker, '__dict__')
+
+    def test_update_increment_default(self, capture):
         """Test update method with default increment."""
         tracker = ProgressTracker(10, "Testing")
         
@@ -42,8 +83,7 @@ class TestProgressTracker:
         
         assert tracker.current == 1
 
-    @patch('sys.stdout')
-    def test_update_custom_increment(self, mock_stdout):
+    def test_update_custom_increment(self, capture):
         """Test update method with custom increment."""
         tracker = ProgressTracker(10, "Testing")
         
@@ -51,8 +91,7 @@ class TestProgressTracker:
         
         assert tracker.current == 5
 
-    @patch('sys.stdout')
-    def test_update_with_description_change(self, mock_stdout):
+    def test_update_with_description_change(self, capture):
         """Test update method with description change."""
         tracker = ProgressTracker(10, "Testing")
         
@@ -61,8 +100,7 @@ class TestProgressTracker:
         assert tracker.current == 1
         assert tracker.description == "New Description"
 
-    @patch('sys.stdout')
-    def test_update_multiple_times(self, mock_stdout):
+    def test_update_multiple_times(self, capture):
         """Test multiple update calls."""
         tracker = ProgressTracker(10, "Testing")
         
@@ -72,18 +110,27 @@ class TestProgressTracker:
         
         assert tracker.current == 6
 
-    @patch('sys.stdout')
-    def test_display_progress_zero_total(self, mock_stdout):
+    def test_display_progress_zero_total(self, capture):
         """Test progress display with zero total."""
         tracker = ProgressTracker(0, "Testing")
         
         tracker._display_progress()
         
         # Should not write anything for zero total
-        assert not mock_stdout.write.called
+        assert capture.getvalue() == ""
+
+    def test_display_progress_after_total_change(self, capture):
+        """Test that changing the total after construction is reflected."""
+        tracker = ProgressTracker(0, "Testing")
+        tracker.total = 4
+        tracker.current = 1
+        
+        tracker._display_progress()
+        
+        assert "1/4" in capture.last_frame
+        assert "25.0%" in capture.last_frame
 
-    @patch('sys.stdout')
-    def test_display_progress_basic_output(self, mock_stdout):
+    def test_display_progress_basic_output(self, capture):
         """Test basic progress display output."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 5
@@ -91,79 +138,74 @@ class TestProgressTracker:
         tracker._display_progress()
         
         # Should write progress bar
-        mock_stdout.write.assert_called()
-        call_args = mock_stdout.write.call_args[0][0]
-        assert "Testing:" in call_args
-        assert "5/10" in call_args
-        assert "50.0%" in call_args
-
-    @patch('sys.stdout')
-    def test_display_progress_bar_visualization(self, mock_stdout):
+        assert capture.getvalue()
+        output = capture.last_frame
+        assert "Testing:" in output
+        assert "5/10" in output
+        assert "50.0%" in output
+
+    def test_display_progress_bar_visualization(self, capture):
         """Test progress bar visualization."""
         tracker = ProgressTracker(4, "Testing")
         tracker.current = 2  # 50% complete
         
         tracker._display_progress()
         
-        call_args = mock_stdout.write.call_args[0][0]
+        output = capture.last_frame
         # Should contain filled and unfilled bar characters
-        assert '█' in call_args  # Filled
-        assert '░' in call_args  # Unfilled
+        assert '█' in output  # Filled
+        assert '░' in output  # Unfilled
 
-    @patch('sys.stdout')
-    def test_display_progress_eta_calculation(self, mock_stdout):
+    def test_display_progress_eta_calculation(self, capture):
         """Test ETA calculation in progress display."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 5
         
         # Mock elapsed time
-        with patch('time.time') as mock_time:
-            mock_time.return_value = tracker.start_time + 10  # 10 seconds elapsed
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = tracker.start_time_ns + 10 * NS_PER_SECOND  # 10 seconds elapsed
             
             tracker._display_progress()
             
-            call_args = mock_stdout.write.call_args[0][0]
+            output = capture.last_frame
             # ETA should be calculated for remaining work
-            assert "ETA:" in call_args
+            assert "ETA:" in output
 
-    @patch('sys.stdout')
-    def test_display_progress_no_eta_for_zero_current(self, mock_stdout):
+    def test_display_progress_no_eta_for_zero_current(self, capture):
         """Test no ETA display when current is zero."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 0
         
         tracker._display_progress()
         
-        call_args = mock_stdout.write.call_args[0][0]
+        output = capture.last_frame
         # Should not show ETA when no progress made
-        assert "ETA:" not in call_args
+        assert "ETA:" not in output
 
-    @patch('sys.stdout')
-    def test_display_progress_newline_when_complete(self, mock_stdout):
+    def test_display_progress_newline_when_complete(self, capture):
         """Test newline is printed when progress is complete."""
         tracker = ProgressTracker(5, "Testing")
         tracker.current = 5  # Complete
         
         with patch('builtins.print') as mock_print:
             tracker._display_progress()
-            
-            # Should print newline when complete
-            mock_print.assert_called_once_with()
+        
+        # The newline goes to the tracker's stream, not the global stdout
+        mock_print.assert_not_called()
+        assert capture.getvalue().endswith('(100.0%)\n')
+        assert capture.flushes == 1
 
-    @patch('sys.stdout')
-    def test_display_progress_no_newline_when_incomplete(self, mock_stdout):
+    def test_display_progress_no_newline_when_incomplete(self, capture):
         """Test no newline when progress is incomplete."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 5
         
-        with patch('builtins.print') as mock_print:
-            tracker._display_progress()
-            
-            # Should not print newline when incomplete
-            mock_print.assert_not_called()
+        tracker._display_progress()
+        
+        # Should not write a newline when incomplete
+        assert '\n' not in capture.getvalue()
 
-    @patch('sys.stdout')
-    def test_finish_method(self, mock_stdout):
+    def test_finish_method(self, capture):
         """Test finish method functionality."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 7
@@ -173,8 +215,7 @@ class TestProgressTracker:
         assert tracker.current == tracker.total
         assert tracker.description == "Completed Successfully"
 
-    @patch('sys.stdout')
-    def test_finish_with_default_description(self, mock_stdout):
+    def test_finish_with_default_description(self, capture):
         """Test finish method with default description."""
         tracker = ProgressTracker(10, "Testing")
         
@@ -183,97 +224,131 @@ class TestProgressTracker:
         assert tracker.current == tracker.total
         assert tracker.description == "Complete"
 
-    @patch('sys.stdout')
-    def test_percent_calculation_accuracy(self, mock_stdout):
+    def test_percent_calculation_accuracy(self, capture):
         """Test percentage calculation accuracy."""
         tracker = ProgressTracker(3, "Testing")
         tracker.current = 1
         
         tracker._display_progress()
         
-        call_args = mock_stdout.write.call_args[0][0]
+        output = capture.last_frame
         # 1/3 should be 33.3%
-        assert "33.3%" in call_args
+        assert "33.3%" in output
 
-    @patch('sys.stdout')
-    def test_bar_length_calculation(self, mock_stdout):
+    def test_bar_length_calculation(self, capture):
         """Test progress bar length calculation."""
         tracker = ProgressTracker(40, "Testing")  # Same as bar_length
         tracker.current = 20  # 50%
         
         tracker._display_progress()
         
-        call_args = mock_stdout.write.call_args[0][0]
+        output = capture.last_frame
         # Should have equal filled and unfilled parts
-        filled_count = call_args.count('█')
-        unfilled_count = call_args.count('░')
+        filled_count = output.count('█')
+        unfilled_count = output.count('░')
         assert filled_count == 20
         assert unfilled_count == 20
 
-    @patch('sys.stdout')
-    def test_stdout_flush_called(self, mock_stdout):
+    def test_stdout_flush_called(self, capture):
         """Test that stdout.flush() is called."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 5
         
         tracker._display_progress()
         
-        mock_stdout.flush.assert_called_once()
+        assert capture.flushes == 1
+
+    def test_piped_output_writes_json_lines(self):
+        """Test that non-terminal output gets one JSON object per frame."""
+        with patch('sys.stdout', new_callable=StringIO) as fake_stdout:
+            tracker = ProgressTracker(4, "Piped")
+            tracker.update()
+            tracker.finish()
+        
+        lines = fake_stdout.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"description": "Piped", "current": 1, "total": 4, "percent": 25.0},
+            {"description": "Complete", "current": 4, "total": 4, "percent": 100.0},
+        ]
+
+    def test_piped_output_is_throttled_to_pipe_interval(self):
+        """Test that piped progress is written at the slower pipe frame rate."""
+        with patch('sys.stdout', new_callable=StringIO) as fake_stdout:
+            tracker = ProgressTracker(10, "Piped")
+            
+            with patch('time.monotonic_ns') as mock_monotonic_ns:
+                mock_monotonic_ns.return_value = tracker.start_time_ns
+                tracker.update()
+                
+                mock_monotonic_ns.return_value += ProgressTracker.FRAME_INTERVAL_NS
+                tracker.update()
+        
+        assert len(fake_stdout.getvalue().splitlines()) == 1
 
     def test_time_tracking(self):
         """Test that start time is properly tracked."""
-        with patch('time.time') as mock_time:
-            mock_time.return_value = 1234567890.0
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = 1234567890 * NS_PER_SECOND
             
             tracker = ProgressTracker(10, "Testing")
             
             assert tracker.start_time == 1234567890.0
 
-    @patch('sys.stdout')
-    def test_eta_formatting_seconds(self, mock_stdout):
+    def test_eta_formatting_seconds(self, capture):
         """Test ETA formatting for seconds."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 5
         
         # Mock 10 seconds elapsed, expect 10 more seconds
-        with patch('time.time') as mock_time:
-            mock_time.return_value = tracker.start_time + 10
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = tracker.start_time_ns + 10 * NS_PER_SECOND
             
             tracker._display_progress()
             
-            call_args = mock_stdout.write.call_args[0][0]
-            assert "ETA: 10s" in call_args
+            output = capture.last_frame
+            assert "ETA: 10s" in output
 
-    @patch('sys.stdout')
-    def test_eta_short_time_no_display(self, mock_stdout):
+    def test_eta_uses_smoothed_rate(self, capture):
+        """Test that the ETA follows the moving average of update rates."""
+        tracker = ProgressTracker(10, "Testing")
+        
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = tracker.start_time_ns + 10 * NS_PER_SECOND
+            tracker.update()  # 0.1 items/s seeds the average
+            
+            mock_monotonic_ns.return_value += NS_PER_SECOND
+            tracker.update()  # 1 item/s sample -> 0.19 items/s
+        
+        # 8 remaining at 0.19 items/s
+        assert "ETA: 42s" in capture.last_frame
+
+    def test_eta_short_time_no_display(self, capture):
         """Test ETA not displayed for very short remaining times."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 9
         
         # Mock very short remaining time
-        with patch('time.time') as mock_time:
-            mock_time.return_value = tracker.start_time + 0.1
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = tracker.start_time_ns + NS_PER_SECOND // 10
             
             tracker._display_progress()
             
-            call_args = mock_stdout.write.call_args[0][0]
+            output = capture.last_frame
             # Should not show ETA for very short times
-            assert "ETA:" not in call_args
+            assert "ETA:" not in output
 
-    @patch('sys.stdout')
-    def test_carriage_return_in_output(self, mock_stdout):
+    def test_carriage_return_in_output(self, capture):
         """Test that carriage return is used to overwrite line."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 5
         
         tracker._display_progress()
         
-        call_args = mock_stdout.write.call_args[0][0]
+        output = capture.last_frame
         # Should start with carriage return to overwrite previous line
-        assert call_args.startswith('\r')
+        assert output.startswith('\r')
 
-    @patch('sys.stdout')
-    def test_progress_beyond_total(self, mock_stdout):
+    def test_progress_beyond_total(self, capture):
         """Test behavior when progress exceeds total."""
         tracker = ProgressTracker(10, "Testing")
         tracker.current = 15  # Beyond total
@@ -281,12 +356,11 @@ class TestProgressTracker:
         with patch('builtins.print'):  # Mock print to avoid newline interference
             tracker._display_progress()
         
-        call_args = mock_stdout.write.call_args[0][0]
+        output = capture.last_frame
         # Should handle gracefully
-        assert "15/10" in call_args
+        assert "15/10" in output
 
-    @patch('sys.stdout')
-    def test_real_time_progress_simulation(self, mock_stdout):
+    def test_real_time_progress_simulation(self, capture):
         """Test realistic progress update simulation."""
         tracker = ProgressTracker(5, "Processing Items")
         
@@ -298,23 +372,36 @@ class TestProgressTracker:
         assert tracker.current == 5
         assert tracker.description == "Processing item 5"
         
-        # Should have called display for each update
-        assert mock_stdout.write.call_count == 5
+        # Should draw the first and final frames; the updates in between are throttled
+        assert capture.getvalue().count('\r') == 2
+
+    def test_redraw_after_frame_interval(self, capture):
+        """Test that a throttled tracker redraws once the frame interval has passed."""
+        tracker = ProgressTracker(10, "Testing")
+        
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = tracker.start_time_ns
+            tracker.update()
+            tracker.update()
+            
+            mock_monotonic_ns.return_value = tracker.start_time_ns + ProgressTracker.FRAME_INTERVAL_NS
+            tracker.update()
+        
+        assert capture.getvalue().count('\r') == 2
+        assert "3/10" in capture.last_frame
 
-    @patch('sys.stdout')
-    def test_edge_case_single_item_total(self, mock_stdout):
+    def test_edge_case_single_item_total(self, capture):
         """Test edge case with total of 1."""
         tracker = ProgressTracker(1, "Single Item")
         
         with patch('builtins.print'):  # Mock print to avoid newline interference
             tracker.update()
         
-        call_args = mock_stdout.write.call_args[0][0]
-        assert "1/1" in call_args
-        assert "100.0%" in call_args
+        output = capture.last_frame
+        assert "1/1" in output
+        assert "100.0%" in output
 
-    @patch('sys.stdout')
-    def test_zero_increment_update(self, mock_stdout):
+    def test_zero_increment_update(self, capture):
         """Test update with zero increment."""
         tracker = ProgressTracker(10, "Testing")
         initial_current = tracker.current
@@ -322,4 +409,19 @@ class TestProgressTracker:
         tracker.update(0, "Status Update")
         
         assert tracker.current == initial_current
-        assert tracker.description == "Status Update"
\ No newline at end of file
+        assert tracker.description == "Status Update"
+
+    def test_unchanged_frame_not_redrawn(self, capture):
+        """Test that an update that changes nothing visible skips the redraw."""
+        tracker = ProgressTracker(10, "Testing")
+        
+        with patch('time.monotonic_ns') as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = tracker.start_time_ns + NS_PER_SECOND
+            tracker.update(1)
+            
+            mock_monotonic_ns.return_value += ProgressTracker.FRAME_INTERVAL_NS
+            tracker.update(0)
+            tracker.update(0, "Status Update")
+        
+        assert capture.getvalue().count('\r') == 2
+        assert "Status Update:" in capture.last_frame
\ No newline at end of file
@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 
 from src.core.scrapling_runner_refactored import ScraplingRunner
+from src.core.scrapling_runner import BatchScraplingRunner
 from src.models.scraping_template import (
     ScrapingTemplate, 
     ElementSelector, 
@@ -278,8 +279,10 @@ class TestBatchScraplingRunner:
         
         assert batch_runner.template == sample_template
     
+    @patch('src.core.scrapling_runner.time.sleep')
+    @patch('src.core.scrapling_runner.PlayWrightFetcher')
     @patch('src.core.scrapling_runner.ScraplingRunner')
-    def test_execute_batch(self, mock_runner_class, sample_template):
+    def test_execute_batch(self, mock_runner_class, mock_fetcher_class, mock_sleep, sample_template):
         """Test batch execution."""
         # Mock the individual runner
         mock_runner = Mock()
@@ -303,6 +306,40 @@ class TestBatchScraplingRunner:
         # Verify runner was called for each URL
         assert mock_runner_class.call_count == 2
         assert mock_runner.execute_scraping.call_count == 2
+        
+        # Every runner reuses the batch's single fetcher, which is closed afterwards
+        mock_fetcher_class.assert_called_once_with()
+        shared_fetcher = mock_fetcher_class.return_value
+        assert all(call.kwargs["fetcher"] is shared_fetcher for call in mock_runner_class.call_args_list)
+        shared_fetcher.browser.close.assert_called_once()
+        shared_fetcher.playwright.stop.assert_called_once()
+
+    @patch('src.core.scrapling_runner.PlayWrightFetcher')
+    @patch('src.core.scrapling_runner.ScraplingRunner')
+    def test_execute_batch_concurrent(self, mock_runner_class, mock_fetcher_class, sample_template):
+        """Test concurrent batch execution keeps results in URL order."""
+        def make_runner(url_template, fetcher=None):
+            runner = Mock()
+            runner.execute_scraping.return_value = ScrapingResult(
+                template_name="test",
+                url=url_template.url,
+                success=True
+            )
+            return runner
+        
+        mock_runner_class.side_effect = make_runner
+        
+        batch_runner = BatchScraplingRunner(sample_template, max_workers=4)
+        urls = [f"https://example{i}.com" for i in range(5)]
+        
+        results = batch_runner.execute_batch(urls)
+        
+        assert [result.url for result in results] == urls
+        assert mock_runner_class.call_count == 5
+        
+        # Concurrent workers never share a browser
+        assert all(call.kwargs["fetcher"] is None for call in mock_runner_class.call_args_list)
+        mock_fetcher_class.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from typing import Dict, Any, List
 
-from src.core.processors.subpage_processor import SubpageProcessor
+from src.core.processors.subpage_processor import SubpageProcessor, _selector_attempts
 from src.core.context import ScrapingContext
 from src.models.scraping_template import ScrapingTemplate, ElementSelector
 
@@ -94,6 +94,56 @@ class TestSubpageProcessor:
         assert result == {"enhanced": "data"}
         processor.extract_subpage_data.assert_called_once_with(element, scraped_data)
 
+    def test_populate_sublink_queue_skips_duplicate_links(self, processor):
+        """Test that a profile linked from several containers is queued once."""
+        hrefs = ["https://example.com/lawyer/a", "https://example.com/lawyer/b", "https://example.com/lawyer/a"]
+        containers = []
+        for href in hrefs:
+            link = Mock()
+            link.get_attribute.return_value = href
+            container = Mock()
+            container.css.return_value = [link]
+            containers.append(container)
+        processor.get_main_container_elements_for_subpage = Mock(return_value=containers)
+        
+        with patch('builtins.print'):
+            processor.populate_sublink_queue()
+        
+        assert [item['url'] for item in processor.sublink_queue] == hrefs[:2]
+        assert [item['container_index'] for item in processor.sublink_queue] == [0, 1]
+
+    def test_extract_subpage_data_merges_fields_per_profile(self, processor):
+        """Test that subpage fields from dict and object sub-elements merge into each item."""
+        office = Mock()
+        office.label = "office"
+        office.selector = ".office"
+        office.element_type = "text"
+        element_config = Mock()
+        element_config.follow_links = True
+        element_config.label = "people"
+        element_config.subpage_elements = [{"label": "bio", "selector": ".bio"}, office]
+        
+        def page_for(url):
+            page = Mock()
+            page.css.side_effect = lambda selector: [Mock(text=f"{selector} of {url}")]
+            return page
+        processor.fetch_page = Mock(side_effect=page_for)
+        main_data = {"people": [
+            {"name": "A", "_profile_link": "https://example.com/lawyer/a"},
+            {"name": "B", "_profile_link": "https://example.com/lawyer/b"},
+        ]}
+        
+        with patch('src.core.processors.subpage_processor.time.sleep'):
+            result = processor.extract_subpage_data(element_config, main_data)
+        
+        assert result["people"][1] == {
+            "name": "B",
+            "_profile_link": "https://example.com/lawyer/b",
+            "bio": ".bio of https://example.com/lawyer/b",
+            "office": ".office of https://example.com/lawyer/b",
+        }
+        assert result["people"][0]["office"] == ".office of https://example.com/lawyer/a"
+
     def test_extract_subpage_container_data_success(self, processor, mock_page):
         """Test successful subpage container data extraction."""
         # Create element config with sub_elements
@@ -240,6 +290,28 @@ class TestSubpageProcessor:
         
         assert result == expected
 
+    def test_extract_subpage_container_data_strips_single_text(self, processor, mock_page):
+        """Test that a single value is stripped and a 'None' placeholder is dropped."""
+        element_config = Mock()
+        element_config.sub_elements = [
+            {"label": "bio", "selector": ".bio", "element_type": "text"},
+            {"label": "office", "selector": ".office", "element_type": "text"}
+        ]
+        
+        mock_subpage = Mock()
+        bio_element = Mock()
+        bio_element.text = "  Valid biography text \n"
+        office_element = Mock()
+        office_element.text = " None "
+        mock_subpage.css.side_effect = [[bio_element], [office_element]]
+        
+        processor.fetch_page = Mock(return_value=mock_subpage)
+        processor.map_generic_selector = Mock(side_effect=lambda x, y: x.get('selector'))
+        
+        result = processor.extract_subpage_container_data("/profile/123", element_config)
+        
+        assert result == {"bio": "Valid biography text"}
+
     def test_extract_subpage_container_data_object_sub_elements(self, processor, mock_page):
         """Test subpage extraction with object-style sub_elements."""
         # Create sub-element objects instead of dictionaries
@@ -348,6 +420,47 @@ class TestSubpageProcessor:
         
         assert result is None
 
+    def test_fetch_subpage_reuses_recent_pages(self, processor):
+        """Test that repeat subpage visits reuse the fetched page."""
+        page = Mock(status=200)
+        processor.fetch_page = Mock(return_value=page)
+        
+        first = processor._fetch_subpage("https://example.com/lawyer/a")
+        second = processor._fetch_subpage("https://example.com/lawyer/a#bio")
+        
+        assert first is page and second is page
+        processor.fetch_page.assert_called_once_with("https://example.com/lawyer/a")
+
+    def test_fetch_subpage_does_not_cache_failures(self, processor):
+        """Test that a failed fetch is retried on the next visit."""
+        processor.fetch_page = Mock(side_effect=[None, Mock(status=200)])
+        
+        assert processor._fetch_subpage("https://example.com/lawyer/a") is None
+        assert processor._fetch_subpage("https://example.com/lawyer/a") is not None
+        assert processor.fetch_page.call_count == 2
+
+    def test_fetch_subpage_does_not_cache_error_responses(self, processor):
+        """Test that a non-200 page is returned but fetched again on the next visit."""
+        error_page = Mock(status=404)
+        page = Mock(status=200)
+        processor.fetch_page = Mock(side_effect=[error_page, page])
+        
+        assert processor._fetch_subpage("https://example.com/lawyer/a") is error_page
+        assert processor._fetch_subpage("https://example.com/lawyer/a") is page
+        assert processor.fetch_page.call_count == 2
+        assert list(processor._page_cache) == ["https://example.com/lawyer/a"]
+
+    def test_fetch_subpage_evicts_least_recently_used(self, processor):
+        """Test that the page cache stays within its size limit."""
+        processor.PAGE_CACHE_SIZE = 2
+        processor.fetch_page = Mock(side_effect=lambda url: Mock(status=200))
+        
+        for url in ("/a", "/b", "/a", "/c", "/b"):
+            processor._fetch_subpage(url)
+        
+        assert [call.args[0] for call in processor.fetch_page.call_args_list] == ["/a", "/b", "/c", "/b"]
+        assert list(processor._page_cache) == ["/c", "/b"]
+
     def test_map_generic_selector_enhancement(self, processor):
         """Test generic selector enhancement mapping."""
         sub_element = {"label": "name", "selector": "strong", "element_type": "text"}
@@ -391,6 +504,12 @@ class TestSubpageProcessor:
         
         assert result == expected
 
+    def test_selector_attempts_split_once_per_group(self):
+        """Test that selector groups are split into stripped parts and cached."""
+        assert _selector_attempts(".name, .person-name,, h1") == (".name", ".person-name", "h1")
+        
+        assert _selector_attempts(".name, .person-name,, h1") is _selector_attempts(".name, .person-name,, h1")
+
     def test_context_restoration_after_exception(self, processor, mock_page):
         """Test that original page context is restored even after exception."""
         original_page = processor.current_page
@@ -413,6 +532,34 @@ class TestSubpageProcessor:
         # Context should be restored
         assert processor.current_page == original_page
 
+    def test_context_restored_when_no_original_page(self, processor):
+        """Test that a missing original page is restored rather than left as the subpage."""
+        processor.current_page = None
+        element_config = Mock()
+        element_config.sub_elements = [
+            {"label": "name", "selector": ".name", "element_type": "text"}
+        ]
+        mock_subpage = Mock()
+        mock_subpage.css.return_value = [Mock(text="John Doe")]
+        
+        processor.fetch_page = Mock(return_value=mock_subpage)
+        processor.map_generic_selector = Mock(side_effect=lambda x, y: x.get('selector'))
+        
+        result = processor.extract_subpage_container_data("/profile/123", element_config)
+        
+        assert result == {"name": "John Doe"}
+        assert processor.current_page is None
+
+    def test_extract_subpage_data_alt_fetch_error(self, processor):
+        """Test that a failing fetch leaves the original page in place."""
+        original_page = processor.current_page
+        processor.fetch_page = Mock(side_effect=Exception("Network error"))
+        
+        result = processor.extract_subpage_data_alt("/profile/123", [])
+        
+        assert result == {}
+        assert processor.current_page is original_page
+
     def test_enhanced_selector_logging(self, processor, mock_page):
         """Test that selector enhancement is properly logged."""
         element_config = Mock()
@@ -436,5 +583,7 @@ class TestSubpageProcessor:
             # Should log the enhancement
             mock_logger.info.assert_called()
             call_args = mock_logger.info.call_args_list
-            enhancement_logged = any("Enhanced subpage selector" in str(call) for call in call_args)
+            enhancement_logged = any(call.args[0].startswith("Enhanced subpage selector") and
+                                     call.args[1:] == ("name", "strong", "h1.person-name strong")
+                                     for call in call_args)
             assert enhancement_logged
\ No newline at end of file